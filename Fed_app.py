@@ -6,12 +6,16 @@ import pandas as pd
 import numpy as np
 import matplotlib.pyplot as plt
 import plotly.graph_objects as go
-import plotly.express as px
 from plotly.subplots import make_subplots
-import requests
 import os
 from dotenv import load_dotenv
 from datetime import datetime, timedelta
+from fed_analysis import (
+    ERA_SERIES, FED_CREATION, NIXON_SHOCK, PREVIEW_AFTER, SELECTED, THEMES, Chart, Line, PageSpec,
+    Panel, SubplotChart, correlation_matrix, data_version, debt_to_gdp, decade_inflation,
+    downsample_figure, get_figure_cache, iter_plan, latest_value, load_era_metrics, load_plan,
+    named_frames, purchasing_power, purchasing_power_lost, resolve_theme, series_metrics
+)
 
 # Load environment variables
 load_dotenv()
@@ -24,6 +28,12 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
+# Text theme of this session: ?theme=neutral in the URL, else the default of the app that
+# ran this script (Fed_app_1.py runs it as 'neutral'), else FED_THEME. All themes are served
+# by one process, sharing its series and figure caches
+theme_name = resolve_theme(st.query_params.get('theme'), globals().get('APP_THEME'))
+theme = THEMES[theme_name]
+
 # Custom CSS for Ron Paul theme with improved visibility
 st.markdown("""
 <style>
@@ -284,9 +294,9 @@ st.markdown("""
 
 # Header and dedication
 st.markdown('<h1 class="main-header">🏛️ The Federal Reserve Analysis Dashboard</h1>', unsafe_allow_html=True)
-st.markdown('''
+st.markdown(f'''
 <div class="dedication">
-"This dashboard presents a detailed analysis of inflation, government spending, and monetary manipulation."
+"{theme['dedication']}"
 <br><br>
 </div>
 ''', unsafe_allow_html=True)
@@ -296,35 +306,106 @@ st.sidebar.title("📊 Analysis Controls")
 st.sidebar.markdown("---")
 
 # Data fetching functions
-@st.cache_data(ttl=3600)  # Cache for 1 hour
-def fetch_fred_data(series_id, api_key, start_date=None, end_date=None):
-    """Fetch data from FRED API with optional date filtering"""
-    endpoint = 'https://api.stlouisfed.org/fred/series/observations'
-    params = {
-        'series_id': series_id,
-        'api_key': api_key,
-        'file_type': 'json'
-    }
-    
-    if start_date:
-        params['observation_start'] = start_date
-    if end_date:
-        params['observation_end'] = end_date
-    
-    try:
-        response = requests.get(endpoint, params=params)
-        data = response.json()
-        df = pd.DataFrame(data['observations'])
-        df = df[df['value'] != '.'].copy()
-        df['value'] = pd.to_numeric(df['value'])
-        df['date'] = pd.to_datetime(df['date'])
-        df = df.rename(columns={'value': series_id})
-        return df[['date', series_id]]
-    except Exception as e:
+def fetch_page(plan, api_key, names=None, parts=()):
+    """Load everything a page plan reads, returning DataFrames keyed by load name and series id"""
+    # The union of the plan's series is fetched in one concurrent batch in the background, each
+    # series once at full history, and the loads in names (all by default) are sliced from it
+    # in memory. Parts are (series ids, draw) pairs: each draw(page_data) runs as soon as the
+    # series it reads have arrived (or failed), so cards and charts fill in their placeholders
+    # while slower series are still loading. A part may add a preview(arrived series): once the
+    # load has had to wait PREVIEW_AFTER for a series, it is called with whatever has arrived
+    page_data = {name: {} for name in (plan if names is None else names) if name in plan}
+    arrived, pending, previewed = set(), list(parts), {}
+    slow = False
+    
+    def draw_ready():
+        for part in list(pending):
+            if arrived.issuperset(part[0]):
+                pending.remove(part)
+                part[1](page_data)
+    
+    draw_ready()
+    for series_id, windows, e in iter_plan(plan, api_key, names=names, tick=PREVIEW_AFTER):
+        if series_id is None:
+            slow = True
+        else:
+            if e is not None:
+                st.error(f"Error fetching {series_id}: {str(e)}")
+            for name, df in windows.items():
+                if not df.empty:
+                    page_data[name][series_id] = df.rename(columns={'value': series_id})
+            arrived.add(series_id)
+            draw_ready()
+        if slow:
+            for part in pending[:]:
+                shown = arrived.intersection(part[0])
+                if len(part) > 2 and shown and shown != previewed.get(part[1]):
+                    previewed[part[1]] = shown
+                    part[2](arrived)
+    return page_data
+
+def chart_slot(page, plan, chart_key, api_key, then=None):
+    """Reserve a chart's place on the page and return the part drawing it once its series arrive"""
+    # then(fig) adds whatever the page shows under a drawn chart, in the same place
+    chart = page.chart(chart_key)
+    slot = st.empty()
+    
+    def draw(page_data):
+        with slot.container():
+            fig = render_chart(page, plan, chart_key, api_key)
+            if fig is not None and then is not None:
+                then(fig)
+    
+    def preview(arrived):
+        # Draw the panels whose series have arrived while the others are still loading; the
+        # preview is neither cached nor zoomable, and the complete chart replaces it
+        start_date, end_date, max_points, series_ids = plan[chart_key]
+        load = (start_date, end_date, max_points, [s for s in series_ids if s in arrived])
+        frames = named_frames(load_plan({chart_key: load}, api_key)[0][chart_key])
+        fig = chart.build(chart, frames, start_date, end_date)
+        if fig is not None:
+            with slot.container():
+                show_chart(downsample_figure(fig))
+    
+    if isinstance(chart, SubplotChart):
+        return chart.series, draw, preview
+    return chart.series, draw
+
+def fetch_era_metrics(api_key, start_date, end_date=None):
+    """Fetch an era's average inflation, GDP growth and purchasing power lost, or None without data"""
+    # Metrics of closed eras are pinned in memory, so they render without network or recomputation
+    metrics, errors = load_era_metrics(api_key, start_date, end_date)
+    for series_id, e in errors.items():
         st.error(f"Error fetching {series_id}: {str(e)}")
-        return pd.DataFrame()
+    return metrics
+
+def chart_zoom(chart_key):
+    """Return the (start, end) dates of the box last drawn over a chart, or None when not zoomed"""
+    state = st.session_state.get(chart_key)
+    boxes = state['selection']['box'] if state else []
+    if not boxes:
+        return None
+    start, end = sorted(pd.Timestamp(x) for x in boxes[-1]['x'][:2])
+    return start.strftime('%Y-%m-%d'), end.strftime('%Y-%m-%d')
 
-def get_date_range(time_period):
+def figure_key(chart, series_ids, api_key, start_date, end_date, *extra):
+    """Key a built figure by theme, chart, date window and the data version of its series"""
+    # A rerun with the same key reuses the figure without any pandas or Plotly work; new
+    # data from FRED changes the version, and so the key
+    return (theme_name, chart, start_date, end_date) + extra + (data_version(series_ids, api_key),)
+
+def show_chart(fig, key=None):
+    """Render a Plotly figure, zoomable by box selection when given a key"""
+    # Figures from the figure cache are shared by every session thread, so they are only
+    # read here; downsampling and the drag mode are applied once, before they are stored
+    if key is None:
+        st.plotly_chart(fig, use_container_width=True)
+        return
+    st.plotly_chart(fig, use_container_width=True, key=key, on_select="rerun", selection_mode="box")
+    st.caption("Drag a box over a chart to load that period at full resolution; "
+               "double-click to return to the overview.")
+
+def get_date_range(time_period, custom_range=None):
     """Get start and end dates based on time period selection"""
     end_date = datetime.now().strftime('%Y-%m-%d')
     
@@ -336,17 +417,77 @@ def get_date_range(time_period):
         start_date = (datetime.now() - timedelta(days=50*365)).strftime('%Y-%m-%d')
     elif time_period == "Last 20 Years":
         start_date = (datetime.now() - timedelta(days=20*365)).strftime('%Y-%m-%d')
-    else:  # Custom Range - for now default to Nixon Shock
+    elif custom_range is not None:  # Custom Range picked on the sidebar slider
+        start_date, end_date = (day.strftime('%Y-%m-%d') for day in custom_range)
+    else:  # Custom Range without a pick - default to Nixon Shock
         start_date = "1971-08-15"
     
     return start_date, end_date
 
+def custom_range_control():
+    """Render the Custom Range slider in the sidebar and return the picked start and end days"""
+    # Spans every date a page reads; each move is answered by slicing the cached histories
+    first_day = datetime.strptime(FED_CREATION, '%Y-%m-%d').date()
+    today = datetime.now().date()
+    return st.sidebar.slider(
+        "Custom Range",
+        min_value=first_day,
+        max_value=today,
+        value=(datetime.strptime(NIXON_SHOCK, '%Y-%m-%d').date(), today),
+        format="YYYY-MM-DD",
+        key='custom_range'
+    )
+
+def time_period_control():
+    """Render the Time Period selector in the sidebar and return the selected date range"""
+    # Called from within a page fragment, so a new selection or a slider move reruns that page alone
+    time_period = st.sidebar.selectbox(
+        "Time Period",
+        ["Last 50 Years", "Last 20 Years", "Custom Range"],
+        key='time_period'
+    )
+    custom_range = custom_range_control() if time_period == "Custom Range" else None
+    return get_date_range(time_period, custom_range)
+
+def plan_page(page, start_date, end_date):
+    """Plan the loads of a page for the selected date range and the zoom of each chart"""
+    zooms = {chart.key: chart_zoom(chart.key) for chart in page.charts if chart.zoomable}
+    return page.plan((start_date, end_date), zooms)
+
+@st.fragment
+def render_chart(page, plan, chart_key, api_key):
+    """Draw a page's chart from its planned load, reusing its figure while the data is unchanged"""
+    # Each chart is a fragment of its own: zooming into it reruns this chart alone, which
+    # replans its load for the new zoom from the window the page last ran with
+    chart = page.chart(chart_key)
+    load = plan_page(page, *plan[SELECTED][:2])[chart_key] if chart.zoomable else plan[chart_key]
+    start_date, end_date, max_points, series_ids = load
+    fig_key = figure_key(chart_key, series_ids, api_key, start_date, end_date, max_points)
+    fig = figure_cache.get(fig_key)
+    if fig is None:
+        # The page's batch left the chart's series in the memory cache (and reported those that
+        # failed), so its frames are only sliced now that the figure has to be built
+        frames = named_frames(load_plan({chart_key: load}, api_key)[0][chart_key])
+        fig = chart.build(chart, frames, start_date, end_date)
+        if fig is None:
+            return None
+        if chart.zoomable:
+            # Dragging draws a selection box, which reruns the page zoomed into it (see chart_zoom)
+            fig.update_layout(dragmode='select')
+        # Points beyond one per pixel are invisible but still serialized and drawn by the browser
+        fig = figure_cache.put(fig_key, downsample_figure(fig))
+    show_chart(fig, key=chart_key if chart.zoomable else None)
+    return fig
+
 # Get API key
 api_key = os.getenv('FED_API_KEY')
 if not api_key:
     st.error("⚠️ FRED API key not found. Please set FED_API_KEY in your .env file.")
     st.stop()
 
+# Built figures shared by every session and rerun
+figure_cache = get_figure_cache()
+
 # Sidebar controls
 analysis_type = st.sidebar.selectbox(
     "Choose Analysis Type",
@@ -355,11 +496,6 @@ analysis_type = st.sidebar.selectbox(
      "Fiat Currency Era (Post-1971)", "Two Eras Comparison: Dollar Value & Economic Impact"]
 )
 
-time_period = st.sidebar.selectbox(
-    "Time Period",
-    ["Last 50 Years", "Last 20 Years"]
-)
-
 # Define FRED series based on the guide
 FRED_SERIES = {
     # Fiscal Policy
@@ -391,345 +527,440 @@ FRED_SERIES = {
     'MEHOINUSA672N': 'Real Median Household Income'
 }
 
-# Main analysis section
-if analysis_type == "Complete Analysis":
-    st.header("🎯 The Complete Analysis: Exposing the Fed's Impact")
+# Chart builders: each draws a figure from the frames of its chart's series
+def subplot_grid(chart):
+    """Return a copy of a SubplotChart's empty grid, laid out once and shared like a built figure"""
+    # The grid is the same whatever the window, and make_subplots costs about as much as the
+    # traces drawn into it, so a new window (a Custom Range move) only copies it
+    grid_key = (theme_name, chart.key, 'grid')
+    grid = figure_cache.get(grid_key)
+    if grid is None:
+        grid = make_subplots(
+            rows=chart.rows, cols=chart.cols,
+            subplot_titles=[panel.title for panel in chart.panels],
+            vertical_spacing=chart.vertical_spacing
+        )
+        grid.update_layout(height=chart.height, showlegend=chart.showlegend, title_text=chart.title)
+        grid = figure_cache.put(grid_key, grid)
+    return go.Figure(grid)
+
+def draw_subplots(chart, frames, start_date, end_date):
+    """Draw the grid of line panels laid out by a SubplotChart"""
+    fig = subplot_grid(chart)
+    
+    # Traces are placed by their axis names (x, x2, ... row by row), all added at once
+    traces = []
+    for i, (row, col, panel) in enumerate(chart.positions()):
+        axis = str(i + 1) if i else ''
+        for line in panel.lines:
+            if line.series_id in frames:
+                series_data = frames[line.series_id]
+                traces.append(
+                    go.Scatter(x=series_data['date'], y=series_data[line.series_id], 
+                              name=line.name, line=dict(color=line.color, width=line.width),
+                              xaxis='x' + axis, yaxis='y' + axis)
+                )
+    
+    fig.add_traces(traces)
+    return fig
+
+def draw_correlations(chart, frames, start_date, end_date):
+    """Draw the correlation heatmap of a chart's series"""
+    if len(frames) < 3:
+        return None
+    
+    # Calculate correlation matrix, on the finest calendar all the series share
+    corr_matrix = correlation_matrix(frames)
+    
+    # Create correlation heatmap, laid out as px.imshow would lay it out but built directly:
+    # px.imshow spends ~40 ms setting up, which every Custom Range move would pay
+    fig = go.Figure(go.Heatmap(
+        z=corr_matrix.to_numpy(),
+        x=corr_matrix.columns.to_numpy(),
+        y=corr_matrix.index.to_numpy(),
+        name='0',
+        coloraxis='coloraxis',
+        xaxis='x',
+        yaxis='y',
+        hovertemplate='x: %{x}<br>y: %{y}<br>color: %{z}<extra></extra>'
+    ))
+    
+    fig.update_layout(
+        title_text=chart.title,
+        xaxis=dict(anchor='y', domain=[0.0, 1.0]),
+        yaxis=dict(anchor='x', domain=[0.0, 1.0], autorange='reversed'),
+        coloraxis=dict(colorscale='RdBu_r', autocolorscale=False)
+    )
+    return fig
+
+def draw_debt_to_gdp(chart, frames, start_date, end_date):
+    """Draw federal debt as a share of GDP"""
+    if 'FYGFDPUN' not in frames or 'GDP' not in frames:
+        return None
+    
+    # Put debt and GDP on one quarterly calendar and calculate ratio
+    combined = debt_to_gdp(frames)
+    
+    # Plot debt-to-GDP trend
+    fig = go.Figure()
+    fig.add_trace(go.Scatter(
+        x=combined.index, 
+        y=combined['debt_to_gdp'],
+        mode='lines',
+        name='Debt-to-GDP Ratio',
+        line=dict(color='red', width=3)
+    ))
+    
+    fig.update_layout(
+        title=chart.title,
+        xaxis_title="Year",
+        yaxis_title="Debt-to-GDP Ratio (%)",
+        height=500
+    )
+    return fig
+
+def draw_purchasing_power(chart, frames, start_date, end_date):
+    """Draw the purchasing power of the dollar relative to the first CPI observation"""
+    if 'CPIAUCSL' not in frames:
+        return None
+    
+    cpi_data = frames['CPIAUCSL']
+    
+    # Calculate purchasing power relative to the first data point available
+    fig = go.Figure()
+    fig.add_trace(go.Scatter(
+        x=cpi_data['date'],
+        y=purchasing_power(cpi_data['CPIAUCSL']),
+        mode='lines',
+        name='Dollar Purchasing Power',
+        line=dict(color='red', width=3),
+        fill='tonexty'
+    ))
+    
+    first_date = cpi_data['date'].iloc[0].strftime('%Y')
+    fig.update_layout(
+        title=chart.title.format(first_date=first_date),
+        xaxis_title="Year",
+        yaxis_title=f"Purchasing Power ({first_date} = 1.00)",
+        height=500
+    )
+    return fig
+
+def draw_decades(chart, frames, start_date, end_date):
+    """Draw average year-over-year CPI inflation per decade"""
+    if 'CPIAUCSL' not in frames:
+        return None
+    
+    decade_df = decade_inflation(frames['CPIAUCSL']['date'], frames['CPIAUCSL']['CPIAUCSL'])
+    if decade_df.empty:
+        return None
+    
+    fig = go.Figure()
+    fig.add_trace(go.Bar(
+        x=decade_df['decade'],
+        y=decade_df['avg_inflation'],
+        marker_color=['red' if x > 5 else 'orange' if x > 3 else 'green' for x in decade_df['avg_inflation']],
+        text=[f"{x:.1f}%" for x in decade_df['avg_inflation']],
+        textposition='auto'
+    ))
+    
+    fig.update_layout(
+        title=chart.title,
+        xaxis_title="Decade",
+        yaxis_title="Average Annual Inflation (%)",
+        height=400
+    )
+    return fig
+
+# Page registry: the series each analysis reads over which date ranges, and the charts it
+# draws. SELECTED is the range picked in the sidebar; each page's loads are planned from
+# its spec and fetched in one batch
+PAGES = {
+    "Complete Analysis": PageSpec(
+        series={SELECTED: ['M2SL', 'CPIAUCSL', 'FGEXPND']},
+        charts=[
+            SubplotChart(
+                'complete_chart', draw_subplots, rows=2, cols=2,
+                title=theme['complete_chart'],
+                showlegend=False,
+                panels=[
+                    Panel('Money Supply Growth (M2)', [Line('M2SL', 'M2 Money Supply', 'red', 3)]),
+                    Panel('Inflation Erosion (CPI)', [Line('CPIAUCSL', 'Consumer Price Index', 'orange', 3)]),
+                    Panel('Government Spending Explosion', [Line('FGEXPND', 'Federal Spending', 'blue', 3)]),
+                    Panel('The Fed Funds Rate Manipulation', [Line('FEDFUNDS', 'Fed Funds Rate', 'green', 3)]),
+                ]
+            ),
+            Chart(
+                'complete_correlations', ['M2SL', 'CPIAUCSL', 'FGEXPND', 'DGS10', 'FEDFUNDS', 'GDP'],
+                draw_correlations, title="Correlation Matrix: How Fed Policies Connect"
+            ),
+        ]
+    ),
+    "Fiscal Policy Deep Dive": PageSpec(
+        charts=[
+            Chart(
+                'fiscal_debt_to_gdp', ['FYGFDPUN', 'GDP'], draw_debt_to_gdp,
+                title="🚨 Federal Debt-to-GDP Ratio: The Unsustainable Path"
+            ),
+        ]
+    ),
+    "Monetary Policy Exposure": PageSpec(
+        series={SELECTED: ['M2SL']},
+        charts=[
+            SubplotChart(
+                'monetary_chart', draw_subplots, rows=2, cols=1, vertical_spacing=0.1,
+                title=theme['monetary_chart'],
+                panels=[
+                    Panel(theme['money_supply_panel'], [
+                        Line('M1SL', 'M1 Money Supply', 'blue'),
+                        Line('M2SL', 'M2 Money Supply', 'red'),
+                    ]),
+                    Panel(theme['inflation_panel'], [Line('CPIAUCSL', 'Consumer Price Index', 'orange')]),
+                ]
+            ),
+        ]
+    ),
+    "Dollar Debasement Tracker": PageSpec(
+        # Always the full historical picture, from the Fed's creation to the present
+        ranges={'history': (FED_CREATION, None)},
+        series={'history': ['CPIAUCSL']},
+        charts=[
+            Chart(
+                'dollar_purchasing_power', ['CPIAUCSL'], draw_purchasing_power, range_name='history',
+                title="💀 Dollar Purchasing Power Decline Since {first_date}"
+            ),
+        ]
+    ),
+    "Bretton Woods Era (1913-1971)": PageSpec(
+        series={SELECTED: ['CPIAUCSL', 'FGEXPND', 'GDP']},
+        charts=[
+            SubplotChart(
+                'bretton_woods_chart', draw_subplots, rows=2, cols=2,
+                title="Bretton Woods Era: Economic Indicators (1913-1971)",
+                showlegend=False,
+                panels=[
+                    Panel('Consumer Price Index', [Line('CPIAUCSL', 'CPI', 'red', 2)]),
+                    Panel('Federal Government Spending', [Line('FGEXPND', 'Federal Spending', 'blue', 2)]),
+                    Panel('Gross Domestic Product', [Line('GDP', 'GDP', 'green', 2)]),
+                    Panel('Unemployment Rate', [Line('UNRATE', 'Unemployment', 'orange', 2)]),
+                ]
+            ),
+        ]
+    ),
+    "Fiat Currency Era (Post-1971)": PageSpec(
+        series={SELECTED: ['M2SL', 'CPIAUCSL', 'FGEXPND', 'FYGFDPUN']},
+        charts=[
+            SubplotChart(
+                'fiat_era_chart', draw_subplots, rows=2, cols=2,
+                title=theme['fiat_era_chart'],
+                showlegend=False,
+                panels=[
+                    Panel('Money Supply Explosion (M2)', [Line('M2SL', 'M2 Money Supply', 'red', 3)]),
+                    Panel('Inflation Acceleration (CPI)', [Line('CPIAUCSL', 'Consumer Price Index', 'orange', 3)]),
+                    Panel('Government Spending Explosion', [Line('FGEXPND', 'Federal Spending', 'blue', 3)]),
+                    Panel('Federal Debt Crisis', [Line('FYGFDPUN', 'Federal Debt', 'purple', 3)]),
+                ]
+            ),
+            Chart(
+                'fiat_era_decades', ['CPIAUCSL'], draw_decades,
+                title="Average Annual Inflation by Decade (Fiat Era)"
+            ),
+        ]
+    ),
+    "Two Eras Comparison: Dollar Value & Economic Impact": PageSpec(
+        # The era metrics read CPI and GDP over both eras
+        ranges={'gold': (FED_CREATION, NIXON_SHOCK), 'fiat': (NIXON_SHOCK, None)},
+        series={'gold': ERA_SERIES, 'fiat': ERA_SERIES},
+        charts=[
+            Chart(
+                'two_eras_purchasing_power', ['CPIAUCSL'], draw_purchasing_power, range_name='fiat',
+                title="💀 Dollar Purchasing Power Decline Since {first_date} (Fiat Era)"
+            ),
+        ]
+    ),
+}
+
+# Main analysis section: every page is a fragment, so changing its time period reruns
+# the page alone, without the styles, the API key check or the sidebar above it
+@st.fragment
+def complete_analysis():
+    """The complete analysis: headline metrics, the dashboard and the correlations"""
+    st.header(theme['complete_header'])
     
     # Get date range based on time period selection
-    start_date, end_date = get_date_range(time_period)
+    start_date, end_date = time_period_control()
+    page = PAGES[analysis_type]
+    plan = plan_page(page, start_date, end_date)
     
     # Display selected time period
     st.info(f"📅 Analyzing data from {start_date} to {end_date}")
     
-    # Fetch key data
-    with st.spinner("Fetching Federal Reserve data..."):
-        # Core datasets for Ron Paul analysis
-        key_series = ['M2SL', 'CPIAUCSL', 'FGEXPND', 'DGS10', 'FEDFUNDS', 'GDP']
-        data_dict = {}
-        
-        for series in key_series:
-            df = fetch_fred_data(series, api_key, start_date, end_date)
-            if not df.empty:
-                data_dict[series] = df
-    
-    if data_dict:
-        # Create the main dashboard
-        col1, col2, col3 = st.columns(3)
-        
-        # Calculate recent metrics
-        latest_m2 = data_dict['M2SL'][data_dict['M2SL']['M2SL'].notna()].iloc[-1]['M2SL'] if 'M2SL' in data_dict else 0
-        latest_cpi = data_dict['CPIAUCSL'][data_dict['CPIAUCSL']['CPIAUCSL'].notna()].iloc[-1]['CPIAUCSL'] if 'CPIAUCSL' in data_dict else 0
-        latest_spending = data_dict['FGEXPND'][data_dict['FGEXPND']['FGEXPND'].notna()].iloc[-1]['FGEXPND'] if 'FGEXPND' in data_dict else 0
-        
+    # Create the main dashboard up front; each card and chart is drawn as soon as its own
+    # series arrive
+    col1, col2, col3 = st.columns(3)
+    
+    # Calculate recent metrics
+    def latest(data_dict, series_id):
+        if series_id not in data_dict:
+            return 0
+        return latest_value(data_dict[series_id][series_id])
+    
+    def m2_card(page_data):
         with col1:
             st.metric(
                 "💰 M2 Money Supply",
-                f"${latest_m2:,.0f}B",
+                f"${latest(page_data[SELECTED], 'M2SL'):,.0f}B",
                 help="The Fed's money printing machine in action"
             )
-        
+    
+    def cpi_card(page_data):
         with col2:
             st.metric(
                 "📈 Consumer Price Index",
-                f"{latest_cpi:.1f}",
+                f"{latest(page_data[SELECTED], 'CPIAUCSL'):.1f}",
                 help="The hidden tax of inflation on American families"
             )
-        
+    
+    def spending_card(page_data):
         with col3:
             st.metric(
                 "🏛️ Federal Spending",
-                f"${latest_spending:,.0f}B",
+                f"${latest(page_data[SELECTED], 'FGEXPND'):,.0f}B",
                 help="Government spending fueling the debt crisis"
             )
-        
-        # The Ron Paul Chart: Money Supply vs Inflation vs Government Spending
-        st.subheader("📊 Money Printing, Inflation, and Government Spending")
-        
-        fig = make_subplots(
-            rows=2, cols=2,
-            subplot_titles=('Money Supply Growth (M2)', 'Inflation Erosion (CPI)', 
-                          'Government Spending Explosion', 'The Fed Funds Rate Manipulation'),
-            specs=[[{"secondary_y": False}, {"secondary_y": False}],
-                   [{"secondary_y": False}, {"secondary_y": False}]]
-        )
-        
-        # Money Supply
-        if 'M2SL' in data_dict:
-            m2_data = data_dict['M2SL']
-            fig.add_trace(
-                go.Scatter(x=m2_data['date'], y=m2_data['M2SL'], 
-                          name='M2 Money Supply', line=dict(color='red', width=3)),
-                row=1, col=1
-            )
-        
-        # Inflation
-        if 'CPIAUCSL' in data_dict:
-            cpi_data = data_dict['CPIAUCSL']
-            fig.add_trace(
-                go.Scatter(x=cpi_data['date'], y=cpi_data['CPIAUCSL'], 
-                          name='Consumer Price Index', line=dict(color='orange', width=3)),
-                row=1, col=2
-            )
-        
-        # Government Spending
-        if 'FGEXPND' in data_dict:
-            spending_data = data_dict['FGEXPND']
-            fig.add_trace(
-                go.Scatter(x=spending_data['date'], y=spending_data['FGEXPND'], 
-                          name='Federal Spending', line=dict(color='blue', width=3)),
-                row=2, col=1
-            )
-        
-        # Fed Funds Rate
-        if 'FEDFUNDS' in data_dict:
-            fed_data = data_dict['FEDFUNDS']
-            fig.add_trace(
-                go.Scatter(x=fed_data['date'], y=fed_data['FEDFUNDS'], 
-                          name='Fed Funds Rate', line=dict(color='green', width=3)),
-                row=2, col=2
-            )
-        
-        fig.update_layout(height=800, showlegend=False, 
-                         title_text="Ron Paul's Warnings Visualized: The Fed's Economic Manipulation")
-        st.plotly_chart(fig, use_container_width=True)
-        
-        # Correlation Analysis
-        st.subheader("🔗 The Dangerous Correlations Ron Paul Warned About")
-        
-        # Calculate correlations between key metrics
-        if len(data_dict) >= 3:
-            # Merge data for correlation analysis
-            merged_data = None
-            for series, df in data_dict.items():
-                if merged_data is None:
-                    merged_data = df.set_index('date')
-                else:
-                    merged_data = merged_data.join(df.set_index('date'), how='outer')
-            
-            if merged_data is not None:
-                # Calculate correlation matrix
-                corr_matrix = merged_data.corr()
-                
-                # Create correlation heatmap
-                fig_corr = px.imshow(corr_matrix, 
-                                   title="Correlation Matrix: How Fed Policies Connect",
-                                   color_continuous_scale='RdBu_r',
-                                   aspect='auto')
-                st.plotly_chart(fig_corr, use_container_width=True)
-                
-                # Key insights
-                st.markdown("""
-                ### 🎯 Key Insights from the Data:
-                
-                1. **Money Supply & Inflation**: Strong positive correlation validates Ron Paul's warnings about monetary debasement
-                2. **Government Spending & Debt**: Exponential growth pattern exactly as predicted
-                3. **Fed Rate Manipulation**: Artificial interest rates distort market signals
-                4. **Wealth Transfer**: Inflation disproportionately hurts savers and fixed-income Americans
-                """)
+    
+    # The Ron Paul Chart: Money Supply vs Inflation vs Government Spending
+    st.subheader("📊 Money Printing, Inflation, and Government Spending")
+    
+    complete_chart = chart_slot(page, plan, 'complete_chart', api_key)
+    
+    # Correlation Analysis
+    st.subheader(theme['correlations_subheader'])
+    
+    def key_insights(fig):
+        # Key insights, in the themes that draw them
+        st.markdown(theme['key_insights'])
+    
+    # Calculate correlations between key metrics (drawn only with at least three series)
+    correlations = chart_slot(page, plan, 'complete_correlations', api_key,
+                              then=key_insights if theme['key_insights'] else None)
+    
+    # Fetch key data
+    with st.spinner("Fetching Federal Reserve data..."):
+        # Core datasets for Ron Paul analysis
+        fetch_page(plan, api_key, page.series_loads(), [
+            (['M2SL'], m2_card),
+            (['CPIAUCSL'], cpi_card),
+            (['FGEXPND'], spending_card),
+            complete_chart,
+            correlations,
+        ])
 
-elif analysis_type == "Fiscal Policy Deep Dive":
-    st.header("💸 Fiscal Policy Deep Dive: The Spending Addiction")
+
+@st.fragment
+def fiscal_policy():
+    """Federal debt against GDP"""
+    st.header(theme['fiscal_header'])
     
-    st.markdown("""
-    *"The government's insatiable appetite for spending, enabled by the Federal Reserve's money printing, 
-    has created an unsustainable debt spiral that threatens the economic future of America."*
-    """)
+    if theme['fiscal_quote']:
+        st.markdown(theme['fiscal_quote'])
     
     # Get date range based on time period selection
-    start_date, end_date = get_date_range(time_period)
+    start_date, end_date = time_period_control()
+    page = PAGES[analysis_type]
+    plan = plan_page(page, start_date, end_date)
     st.info(f"📅 Analyzing fiscal data from {start_date} to {end_date}")
     
     # Fetch fiscal data
-    fiscal_series = ['FGEXPND', 'FYFSD', 'FYGFDPUN', 'GDP']
-    fiscal_data = {}
-    
     with st.spinner("Loading fiscal policy data..."):
-        for series in fiscal_series:
-            df = fetch_fred_data(series, api_key, start_date, end_date)
-            if not df.empty:
-                fiscal_data[series] = df
-    
-    if fiscal_data:
-        # Debt-to-GDP ratio calculation
-        if 'FYGFDPUN' in fiscal_data and 'GDP' in fiscal_data:
-            debt_data = fiscal_data['FYGFDPUN'].set_index('date')
-            gdp_data = fiscal_data['GDP'].set_index('date')
-            
-            # Merge and calculate ratio
-            combined = debt_data.join(gdp_data, how='inner')
-            combined['debt_to_gdp'] = (combined['FYGFDPUN'] / combined['GDP']) * 100
-            
-            # Plot debt-to-GDP trend
-            fig = go.Figure()
-            fig.add_trace(go.Scatter(
-                x=combined.index, 
-                y=combined['debt_to_gdp'],
-                mode='lines',
-                name='Debt-to-GDP Ratio',
-                line=dict(color='red', width=3)
-            ))
-            
-            fig.update_layout(
-                title="🚨 Federal Debt-to-GDP Ratio: The Unsustainable Path",
-                xaxis_title="Year",
-                yaxis_title="Debt-to-GDP Ratio (%)",
-                height=500
-            )
-            
-            st.plotly_chart(fig, use_container_width=True)
-            
-            # Current debt level warning
-            current_ratio = combined['debt_to_gdp'].iloc[-1]
-            st.markdown(f"""
-            <div class="warning-box">
-            <strong>🚨 Current Federal Debt-to-GDP Ratio: {current_ratio:.1f}%</strong><br>
-            </div>
-            """, unsafe_allow_html=True)
+        fetch_page(plan, api_key, page.series_loads())
+    
+    # Debt-to-GDP ratio calculation (drawn only with both debt and GDP)
+    fig = render_chart(page, plan, 'fiscal_debt_to_gdp', api_key)
+    if fig is not None:
+        # Current debt level warning, read off the end of the plotted line (downsampling
+        # always keeps the last point)
+        current_ratio = fig.data[0].y[-1]
+        st.markdown(f"""
+        <div class="warning-box">
+        <strong>🚨 Current Federal Debt-to-GDP Ratio: {current_ratio:.1f}%</strong><br>
+        </div>
+        """, unsafe_allow_html=True)
 
-elif analysis_type == "Monetary Policy Exposure":
-    st.header("🖨️ Monetary Policy Exposure: The Money Printing Machine")
+
+@st.fragment
+def monetary_policy():
+    """Money supply growth and the inflation that follows it"""
+    st.header(theme['monetary_header'])
     
     # Get date range based on time period selection
-    start_date, end_date = get_date_range(time_period)
+    start_date, end_date = time_period_control()
+    page = PAGES[analysis_type]
+    plan = plan_page(page, start_date, end_date)
     st.info(f"📅 Analyzing monetary data from {start_date} to {end_date}")
     
+    # Money supply growth chart
+    monetary_chart = chart_slot(page, plan, 'monetary_chart', api_key)
+    
     # Fetch monetary data
-    monetary_series = ['M1SL', 'M2SL', 'BASE', 'CPIAUCSL', 'FEDFUNDS']
-    monetary_data = {}
-    
-    with st.spinner("Exposing the Fed's monetary manipulation..."):
-        for series in monetary_series:
-            df = fetch_fred_data(series, api_key, start_date, end_date)
-            if not df.empty:
-                monetary_data[series] = df
-    
-    if monetary_data:
-        # Money supply growth chart
-        fig = make_subplots(
-            rows=2, cols=1,
-            subplot_titles=('Money Supply Explosion', 'The Inflation Consequence'),
-            vertical_spacing=0.1
-        )
-        
-        # M1 and M2 money supply
-        if 'M1SL' in monetary_data:
-            m1_data = monetary_data['M1SL']
-            fig.add_trace(
-                go.Scatter(x=m1_data['date'], y=m1_data['M1SL'], 
-                          name='M1 Money Supply', line=dict(color='blue')),
-                row=1, col=1
-            )
-        
-        if 'M2SL' in monetary_data:
-            m2_data = monetary_data['M2SL']
-            fig.add_trace(
-                go.Scatter(x=m2_data['date'], y=m2_data['M2SL'], 
-                          name='M2 Money Supply', line=dict(color='red')),
-                row=1, col=1
-            )
-        
-        # Inflation
-        if 'CPIAUCSL' in monetary_data:
-            cpi_data = monetary_data['CPIAUCSL']
-            fig.add_trace(
-                go.Scatter(x=cpi_data['date'], y=cpi_data['CPIAUCSL'], 
-                          name='Consumer Price Index', line=dict(color='orange')),
-                row=2, col=1
-            )
-        
-        fig.update_layout(height=800, title_text="The Fed's Money Printing and Its Inflationary Consequences")
-        st.plotly_chart(fig, use_container_width=True)
-        
-        # Calculate money supply growth rates
-        if 'M2SL' in monetary_data:
-            m2_data = monetary_data['M2SL'].set_index('date')
-            m2_data['M2_growth'] = m2_data['M2SL'].pct_change(periods=12) * 100  # Year-over-year growth
-            
-            recent_growth = m2_data['M2_growth'].dropna().iloc[-1]
+    with st.spinner(theme['monetary_spinner']):
+        fetch_page(plan, api_key, page.series_loads(), [monetary_chart])
+
 
-elif analysis_type == "Dollar Debasement Tracker":
+@st.fragment
+def dollar_debasement():
+    """The dollar's purchasing power since the Fed's creation"""
     st.header("💵 Dollar Debasement Tracker: The Purchasing Power Destruction")
     
     # For dollar debasement, always show the full historical picture from 1913 to present
-    start_date = "1913-12-23"  # Fed creation date
-    end_date = datetime.now().strftime('%Y-%m-%d')
+    page = PAGES[analysis_type]
+    plan = plan_page(page, *time_period_control())
+    start_date, end_date = plan['history'][:2]
     st.info(f"📅 Analyzing holistic dollar debasement from {start_date} to {end_date}")
     
     # Fetch dollar-related data
-    dollar_series = ['CPIAUCSL', 'DTWEXBGS', 'DGS10']
-    dollar_data = {}
-    
     with st.spinner("Tracking dollar debasement..."):
-        for series in dollar_series:
-            df = fetch_fred_data(series, api_key, start_date, end_date)
-            if not df.empty:
-                dollar_data[series] = df
+        page_data = fetch_page(plan, api_key, page.series_loads())
+        dollar_data = page_data['history']
     
     if 'CPIAUCSL' in dollar_data:
-        cpi_data = dollar_data['CPIAUCSL'].set_index('date')
-        
-        # Calculate purchasing power relative to the first data point available
-        first_cpi = cpi_data['CPIAUCSL'].iloc[0]
-        cpi_data['purchasing_power'] = first_cpi / cpi_data['CPIAUCSL']
-        
-        # Purchasing power chart
-        fig = go.Figure()
-        fig.add_trace(go.Scatter(
-            x=cpi_data.index,
-            y=cpi_data['purchasing_power'],
-            mode='lines',
-            name='Dollar Purchasing Power',
-            line=dict(color='red', width=3),
-            fill='tonexty'
-        ))
+        cpi_metrics = series_metrics('CPIAUCSL', api_key, start_date, end_date)
+        first_date = str(cpi_metrics['dates'][0])[:4]
         
-        first_date = cpi_data.index[0].strftime('%Y')
-        fig.update_layout(
-            title=f"💀 Dollar Purchasing Power Decline Since {first_date}",
-            xaxis_title="Year",
-            yaxis_title=f"Purchasing Power ({first_date} = 1.00)",
-            height=500
-        )
-        
-        st.plotly_chart(fig, use_container_width=True)
+        render_chart(page, plan, 'dollar_purchasing_power', api_key)
         
         # Current purchasing power
-        current_power = cpi_data['purchasing_power'].iloc[-1]
-        destruction_pct = (1 - current_power) * 100
+        current_power = cpi_metrics['first'] / cpi_metrics['last']
+        destruction_pct = purchasing_power_lost(cpi_metrics['first'], cpi_metrics['last'])
         
         st.markdown(f"""
         <div class="warning-box">
-        <strong>💀 Dollar Purchasing Power Lost Since {first_date}: {destruction_pct:.1f}%</strong><br>
-        What cost $1.00 in {first_date} now costs ${1/current_power:.2f}. This demonstrates the hidden tax of inflation that Ron Paul spent his career exposing.
+        <strong>💀 {theme['dollar_lost']} {first_date}: {destruction_pct:.1f}%</strong><br>
+        What cost $1.00 in {first_date} now costs ${1/current_power:.2f}.{theme['dollar_note']}
         </div>
         """, unsafe_allow_html=True)
 
-elif analysis_type == "Bretton Woods Era (1913-1971)":
+
+@st.fragment
+def bretton_woods_era():
+    """Inflation, spending and growth under the managed gold system"""
     st.header("🏦 Bretton Woods Era: The Managed Gold System (1913-1971)")
     
     # Get date range based on time period selection
-    start_date, end_date = get_date_range(time_period)
+    start_date, end_date = time_period_control()
+    page = PAGES[analysis_type]
+    plan = plan_page(page, start_date, end_date)
     
     st.info(f"📅 Analyzing Bretton Woods Era data from {start_date} to {end_date}")
     
-    # Fetch key economic data for this period
-    bretton_woods_series = ['CPIAUCSL', 'FGEXPND', 'GDP', 'UNRATE']
-    bretton_woods_data = {}
+    # Create metrics for the Bretton Woods era and a place for its chart up front; each is
+    # drawn as soon as its own series arrive
+    col1, col2, col3 = st.columns(3)
     
-    with st.spinner("Loading Bretton Woods Era data..."):
-        for series in bretton_woods_series:
-            df = fetch_fred_data(series, api_key, start_date, end_date)
-            if not df.empty:
-                bretton_woods_data[series] = df
-    
-    if bretton_woods_data:
-        # Create metrics for the Bretton Woods era
-        col1, col2, col3 = st.columns(3)
-        
-        # Calculate average metrics for the period
-        if 'CPIAUCSL' in bretton_woods_data:
-            cpi_data = bretton_woods_data['CPIAUCSL']
-            avg_inflation = cpi_data['CPIAUCSL'].pct_change(periods=12).mean() * 100
+    # Calculate average metrics for the period
+    def inflation_card(page_data):
+        if 'CPIAUCSL' in page_data[SELECTED]:
+            avg_inflation = series_metrics('CPIAUCSL', api_key, start_date, end_date)['avg_yoy']
             
             with col1:
                 st.metric(
@@ -737,10 +968,10 @@ elif analysis_type == "Bretton Woods Era (1913-1971)":
                     f"{avg_inflation:.1f}%",
                     help="Inflation during the Bretton Woods era"
                 )
-        
-        if 'FGEXPND' in bretton_woods_data:
-            spending_data = bretton_woods_data['FGEXPND']
-            spending_growth = ((spending_data['FGEXPND'].iloc[-1] / spending_data['FGEXPND'].iloc[0]) ** (1/58) - 1) * 100
+    
+    def spending_card(page_data):
+        if 'FGEXPND' in page_data[SELECTED]:
+            spending_growth = series_metrics('FGEXPND', api_key, start_date, end_date)['cagr']
             
             with col2:
                 st.metric(
@@ -748,10 +979,10 @@ elif analysis_type == "Bretton Woods Era (1913-1971)":
                     f"{spending_growth:.1f}%/year",
                     help="Average annual government spending growth"
                 )
-        
-        if 'GDP' in bretton_woods_data:
-            gdp_data = bretton_woods_data['GDP']
-            gdp_growth = ((gdp_data['GDP'].iloc[-1] / gdp_data['GDP'].iloc[0]) ** (1/58) - 1) * 100
+    
+    def gdp_card(page_data):
+        if 'GDP' in page_data[SELECTED]:
+            gdp_growth = series_metrics('GDP', api_key, start_date, end_date)['cagr']
             
             with col3:
                 st.metric(
@@ -759,85 +990,41 @@ elif analysis_type == "Bretton Woods Era (1913-1971)":
                     f"{gdp_growth:.1f}%/year",
                     help="Average annual GDP growth during Bretton Woods era"
                 )
-        
-        # Create comprehensive chart for Bretton Woods era
-        st.subheader("📊 Bretton Woods Era: The Managed System (1913-1971)")
-        
-        fig = make_subplots(
-            rows=2, cols=2,
-            subplot_titles=('Consumer Price Index', 'Federal Government Spending', 
-                           'Gross Domestic Product', 'Unemployment Rate'),
-            specs=[[{"secondary_y": False}, {"secondary_y": False}],
-                   [{"secondary_y": False}, {"secondary_y": False}]]
-        )
-        
-        # CPI
-        if 'CPIAUCSL' in bretton_woods_data:
-            cpi_data = bretton_woods_data['CPIAUCSL']
-            fig.add_trace(
-                go.Scatter(x=cpi_data['date'], y=cpi_data['CPIAUCSL'], 
-                          name='CPI', line=dict(color='red', width=2)),
-                row=1, col=1
-            )
-        
-        # Government Spending
-        if 'FGEXPND' in bretton_woods_data:
-            spending_data = bretton_woods_data['FGEXPND']
-            fig.add_trace(
-                go.Scatter(x=spending_data['date'], y=spending_data['FGEXPND'], 
-                          name='Federal Spending', line=dict(color='blue', width=2)),
-                row=1, col=2
-            )
-        
-        # GDP
-        if 'GDP' in bretton_woods_data:
-            gdp_data = bretton_woods_data['GDP']
-            fig.add_trace(
-                go.Scatter(x=gdp_data['date'], y=gdp_data['GDP'], 
-                          name='GDP', line=dict(color='green', width=2)),
-                row=2, col=1
-            )
-        
-        # Unemployment
-        if 'UNRATE' in bretton_woods_data:
-            unrate_data = bretton_woods_data['UNRATE']
-            fig.add_trace(
-                go.Scatter(x=unrate_data['date'], y=unrate_data['UNRATE'], 
-                          name='Unemployment', line=dict(color='orange', width=2)),
-                row=2, col=2
-            )
-        
-        fig.update_layout(height=800, showlegend=False, 
-                         title_text="Bretton Woods Era: Economic Indicators (1913-1971)")
-        st.plotly_chart(fig, use_container_width=True)
-        
+    
+    # Create comprehensive chart for Bretton Woods era
+    st.subheader("📊 Bretton Woods Era: The Managed System (1913-1971)")
+    
+    bretton_woods_chart = chart_slot(page, plan, 'bretton_woods_chart', api_key)
+    
+    # Fetch key economic data for this period
+    with st.spinner("Loading Bretton Woods Era data..."):
+        fetch_page(plan, api_key, page.series_loads(), [
+            (['CPIAUCSL'], inflation_card),
+            (['FGEXPND'], spending_card),
+            (['GDP'], gdp_card),
+            bretton_woods_chart,
+        ])
+
 
-elif analysis_type == "Fiat Currency Era (Post-1971)":
+@st.fragment
+def fiat_currency_era():
+    """Money, prices, spending and debt since the Nixon shock, by decade"""
     st.header("💸 Fiat Currency Era: The Great Debasement (Post-1971)")
     
     # Get date range based on time period selection
-    start_date, end_date = get_date_range(time_period)
+    start_date, end_date = time_period_control()
+    page = PAGES[analysis_type]
+    plan = plan_page(page, start_date, end_date)
     
     st.info(f"📅 Analyzing Fiat Currency Era data from {start_date} to {end_date}")
     
-    # Fetch comprehensive data for fiat era
-    fiat_era_series = ['M2SL', 'CPIAUCSL', 'FGEXPND', 'GDP', 'FEDFUNDS', 'FYGFDPUN']
-    fiat_era_data = {}
+    # Calculate dramatic changes since 1971, each card drawn as soon as its own series arrive
+    col1, col2, col3, col4 = st.columns(4)
     
-    with st.spinner("Loading Fiat Currency Era data..."):
-        for series in fiat_era_series:
-            df = fetch_fred_data(series, api_key, start_date, end_date)
-            if not df.empty:
-                fiat_era_data[series] = df
-    
-    if fiat_era_data:
-        # Calculate dramatic changes since 1971
-        col1, col2, col3, col4 = st.columns(4)
-        
-        # Money Supply Explosion
-        if 'M2SL' in fiat_era_data:
-            m2_data = fiat_era_data['M2SL']
-            m2_increase = ((m2_data['M2SL'].iloc[-1] / m2_data['M2SL'].iloc[0]) - 1) * 100
+    # Money Supply Explosion
+    def m2_card(page_data):
+        if 'M2SL' in page_data[SELECTED]:
+            m2_increase = series_metrics('M2SL', api_key, start_date, end_date)['cumulative_change']
             
             with col1:
                 st.metric(
@@ -845,23 +1032,24 @@ elif analysis_type == "Fiat Currency Era (Post-1971)":
                     f"{m2_increase:,.0f}%",
                     help="Total increase in money supply since Nixon Shock"
                 )
-        
-        # Inflation Destruction
-        if 'CPIAUCSL' in fiat_era_data:
-            cpi_data = fiat_era_data['CPIAUCSL']
-            purchasing_power_lost = (1 - (cpi_data['CPIAUCSL'].iloc[0] / cpi_data['CPIAUCSL'].iloc[-1])) * 100
+    
+    # Inflation Destruction
+    def purchasing_power_card(page_data):
+        if 'CPIAUCSL' in page_data[SELECTED]:
+            cpi_metrics = series_metrics('CPIAUCSL', api_key, start_date, end_date)
+            power_lost = purchasing_power_lost(cpi_metrics['first'], cpi_metrics['last'])
             
             with col2:
                 st.metric(
                     "💀 Purchasing Power Lost",
-                    f"{purchasing_power_lost:.0f}%",
+                    f"{power_lost:.0f}%",
                     help="Dollar purchasing power destroyed since 1971"
                 )
-        
-        # Government Spending Explosion
-        if 'FGEXPND' in fiat_era_data:
-            spending_data = fiat_era_data['FGEXPND']
-            spending_increase = ((spending_data['FGEXPND'].iloc[-1] / spending_data['FGEXPND'].iloc[0]) - 1) * 100
+    
+    # Government Spending Explosion
+    def spending_card(page_data):
+        if 'FGEXPND' in page_data[SELECTED]:
+            spending_increase = series_metrics('FGEXPND', api_key, start_date, end_date)['cumulative_change']
             
             with col3:
                 st.metric(
@@ -869,11 +1057,11 @@ elif analysis_type == "Fiat Currency Era (Post-1971)":
                     f"{spending_increase:,.0f}%",
                     help="Total increase in federal spending since 1971"
                 )
-        
-        # National Debt Explosion
-        if 'FYGFDPUN' in fiat_era_data:
-            debt_data = fiat_era_data['FYGFDPUN']
-            debt_increase = ((debt_data['FYGFDPUN'].iloc[-1] / debt_data['FYGFDPUN'].iloc[0]) - 1) * 100
+    
+    # National Debt Explosion
+    def debt_card(page_data):
+        if 'FYGFDPUN' in page_data[SELECTED]:
+            debt_increase = series_metrics('FYGFDPUN', api_key, start_date, end_date)['cumulative_change']
             
             with col4:
                 st.metric(
@@ -881,112 +1069,32 @@ elif analysis_type == "Fiat Currency Era (Post-1971)":
                     f"{debt_increase:,.0f}%",
                     help="Total increase in national debt since 1971"
                 )
-        
-        # The Great Debasement Chart
-        st.subheader("📊 The Great Debasement: Fiat Currency Consequences (1971-Present)")
-        
-        fig = make_subplots(
-            rows=2, cols=2,
-            subplot_titles=('Money Supply Explosion (M2)', 'Inflation Acceleration (CPI)', 
-                           'Government Spending Explosion', 'Federal Debt Crisis'),
-            specs=[[{"secondary_y": False}, {"secondary_y": False}],
-                   [{"secondary_y": False}, {"secondary_y": False}]]
-        )
-        
-        # Money Supply
-        if 'M2SL' in fiat_era_data:
-            m2_data = fiat_era_data['M2SL']
-            fig.add_trace(
-                go.Scatter(x=m2_data['date'], y=m2_data['M2SL'], 
-                          name='M2 Money Supply', line=dict(color='red', width=3)),
-                row=1, col=1
-            )
-        
-        # Inflation
-        if 'CPIAUCSL' in fiat_era_data:
-            cpi_data = fiat_era_data['CPIAUCSL']
-            fig.add_trace(
-                go.Scatter(x=cpi_data['date'], y=cpi_data['CPIAUCSL'], 
-                          name='Consumer Price Index', line=dict(color='orange', width=3)),
-                row=1, col=2
-            )
-        
-        # Government Spending
-        if 'FGEXPND' in fiat_era_data:
-            spending_data = fiat_era_data['FGEXPND']
-            fig.add_trace(
-                go.Scatter(x=spending_data['date'], y=spending_data['FGEXPND'], 
-                          name='Federal Spending', line=dict(color='blue', width=3)),
-                row=2, col=1
-            )
-        
-        # Federal Debt
-        if 'FYGFDPUN' in fiat_era_data:
-            debt_data = fiat_era_data['FYGFDPUN']
-            fig.add_trace(
-                go.Scatter(x=debt_data['date'], y=debt_data['FYGFDPUN'], 
-                          name='Federal Debt', line=dict(color='purple', width=3)),
-                row=2, col=2
-            )
-        
-        fig.update_layout(height=800, showlegend=False, 
-                         title_text="The Fiat Currency Disaster: Ron Paul's Predictions Realized")
-        st.plotly_chart(fig, use_container_width=True)
-        
-        # Decade-by-decade breakdown
-        st.subheader("📊 Decade-by-Decade Breakdown: The Accelerating Crisis")
-        
-        # Create decade analysis for fiat era
-        decades = ['1970s', '1980s', '1990s', '2000s', '2010s', '2020s']
-        decade_ranges = [
-            ('1971-01-01', '1979-12-31'),
-            ('1980-01-01', '1989-12-31'),
-            ('1990-01-01', '1999-12-31'),
-            ('2000-01-01', '2009-12-31'),
-            ('2010-01-01', '2019-12-31'),
-            ('2020-01-01', '2024-12-31')
-        ]
-        
-        decade_data = []
-        
-        for i, (start, end) in enumerate(decade_ranges):
-            decade_info = {'decade': decades[i]}
-            
-            # Calculate average inflation for decade
-            if 'CPIAUCSL' in fiat_era_data:
-                cpi_decade = fiat_era_data['CPIAUCSL'][
-                    (fiat_era_data['CPIAUCSL']['date'] >= start) & 
-                    (fiat_era_data['CPIAUCSL']['date'] <= end)
-                ]
-                if len(cpi_decade) > 12:
-                    decade_info['avg_inflation'] = cpi_decade['CPIAUCSL'].pct_change(periods=12).mean() * 100
-                else:
-                    decade_info['avg_inflation'] = 0
-            
-            decade_data.append(decade_info)
-        
-        # Display decade comparison
-        decade_df = pd.DataFrame(decade_data)
-        if not decade_df.empty and 'avg_inflation' in decade_df.columns:
-            fig_decades = go.Figure()
-            fig_decades.add_trace(go.Bar(
-                x=decade_df['decade'],
-                y=decade_df['avg_inflation'],
-                marker_color=['red' if x > 5 else 'orange' if x > 3 else 'green' for x in decade_df['avg_inflation']],
-                text=[f"{x:.1f}%" for x in decade_df['avg_inflation']],
-                textposition='auto'
-            ))
-            
-            fig_decades.update_layout(
-                title="Average Annual Inflation by Decade (Fiat Era)",
-                xaxis_title="Decade",
-                yaxis_title="Average Annual Inflation (%)",
-                height=400
-            )
-            
-            st.plotly_chart(fig_decades, use_container_width=True)
+    
+    # The Great Debasement Chart
+    st.subheader("📊 The Great Debasement: Fiat Currency Consequences (1971-Present)")
+    
+    fiat_era_chart = chart_slot(page, plan, 'fiat_era_chart', api_key)
+    
+    # Decade-by-decade breakdown
+    st.subheader("📊 Decade-by-Decade Breakdown: The Accelerating Crisis")
+    
+    fiat_era_decades = chart_slot(page, plan, 'fiat_era_decades', api_key)
+    
+    # Fetch comprehensive data for fiat era
+    with st.spinner("Loading Fiat Currency Era data..."):
+        fetch_page(plan, api_key, page.series_loads(), [
+            (['M2SL'], m2_card),
+            (['CPIAUCSL'], purchasing_power_card),
+            (['FGEXPND'], spending_card),
+            (['FYGFDPUN'], debt_card),
+            fiat_era_chart,
+            fiat_era_decades,
+        ])
 
-elif analysis_type == "Two Eras Comparison: Dollar Value & Economic Impact":
+
+@st.fragment
+def two_eras_comparison():
+    """The gold standard and fiat eras side by side"""
     st.header("⚖️ Two Eras Comparison: Dollar Value & Economic Impact")
     
     # Define the two eras with their characteristics
@@ -1001,155 +1109,122 @@ elif analysis_type == "Two Eras Comparison: Dollar Value & Economic Impact":
     st.info("📊 Note: FRED API data is only available from 1913 onwards. The comparison below focuses on the Gold Standard Era (1913-1971) vs Fiat Currency Era (1971-Present) using reliable FRED data.")
     
     # Get date range based on time period selection
-    start_date, end_date = get_date_range(time_period)
+    start_date, end_date = time_period_control()
+    page = PAGES[analysis_type]
+    plan = plan_page(page, start_date, end_date)
     st.info(f"📅 Analyzing comparative data from {start_date} to {end_date}")
     
-    with st.spinner("Loading comparative economic data..."):
-        # Fetch data for the selected time period
-        comparison_series = ['CPIAUCSL', 'FGEXPND', 'GDP', 'M2SL', 'FYGFDPUN']
-        comparison_data = {}
-        
-        for series in comparison_series:
-            df = fetch_fred_data(series, api_key, start_date, end_date)
-            if not df.empty:
-                comparison_data[series] = df
-        
-        # Also fetch historical data for era comparison context
-        gold_era_data = {}
-        fiat_era_data = {}
-        
-        # Gold Standard Era (1913-1971) for historical context
-        gold_series = ['CPIAUCSL', 'FGEXPND', 'GDP']
-        for series in gold_series:
-            df = fetch_fred_data(series, api_key, "1913-12-23", "1971-08-15")
-            if not df.empty:
-                gold_era_data[series] = df
-        
-        # Fiat Currency Era (1971-Present) for historical context
-        fiat_series = ['CPIAUCSL', 'FGEXPND', 'GDP', 'M2SL', 'FYGFDPUN']
-        for series in fiat_series:
-            df = fetch_fred_data(series, api_key, "1971-08-15", datetime.now().strftime('%Y-%m-%d'))
-            if not df.empty:
-                fiat_era_data[series] = df
-    
     # Create comprehensive comparison metrics
     st.subheader("🎯 Key Economic Indicators Comparison")
     
-    # Calculate metrics for each era using only available FRED data
-    era_metrics = {}
+    # Lay out both sections up front: the purchasing power chart is drawn as soon as CPI
+    # arrives, the era comparison once both eras' series have
+    comparison = st.empty()
+    purchasing_power = st.empty()
     
-    # Gold Standard Era
-    if gold_era_data:
-        gold_inflation = 0
-        gold_gdp_growth = 0
-        
-        if 'CPIAUCSL' in gold_era_data:
-            cpi_data = gold_era_data['CPIAUCSL']
-            gold_inflation = cpi_data['CPIAUCSL'].pct_change(periods=12).mean() * 100
-        
-        if 'GDP' in gold_era_data and len(gold_era_data['GDP']) > 1:
-            gdp_data = gold_era_data['GDP']
-            years = len(gdp_data) / 12  # Approximate years
-            gold_gdp_growth = ((gdp_data['GDP'].iloc[-1] / gdp_data['GDP'].iloc[0]) ** (1/years) - 1) * 100
+    def era_comparison(page_data):
+        # Gold Standard Era (1913-1971) for historical context, read from the warm cache
+        gold_start_date, gold_end_date = plan['gold'][:2]
+        gold_metrics = fetch_era_metrics(api_key, gold_start_date, gold_end_date)
         
-        era_metrics['Gold Standard (1913-1971)'] = {
-            'avg_inflation': gold_inflation,
-            'avg_gdp_growth': gold_gdp_growth,
-            'currency_backing': 'Partial Gold',
-            'monetary_system': 'Central Banking'
-        }
-    
-    # Fiat Currency Era
-    if fiat_era_data:
-        fiat_inflation = 0
-        fiat_gdp_growth = 0
-        purchasing_power_lost = 0
-        
-        if 'CPIAUCSL' in fiat_era_data:
-            cpi_data = fiat_era_data['CPIAUCSL']
-            fiat_inflation = cpi_data['CPIAUCSL'].pct_change(periods=12).mean() * 100
-            purchasing_power_lost = (1 - (cpi_data['CPIAUCSL'].iloc[0] / cpi_data['CPIAUCSL'].iloc[-1])) * 100
-        
-        if 'GDP' in fiat_era_data and len(fiat_era_data['GDP']) > 1:
-            gdp_data = fiat_era_data['GDP']
-            years = len(gdp_data) / 12  # Approximate years
-            fiat_gdp_growth = ((gdp_data['GDP'].iloc[-1] / gdp_data['GDP'].iloc[0]) ** (1/years) - 1) * 100
-        
-        era_metrics['Fiat Currency (1971-Present)'] = {
-            'avg_inflation': fiat_inflation,
-            'avg_gdp_growth': fiat_gdp_growth,
-            'dollar_purchasing_power_change': -purchasing_power_lost,
-            'currency_backing': 'None (Fiat)',
-            'monetary_system': 'Central Bank Monopoly'
-        }
-    
-    # Only create charts if we have data for both eras
-    if len(era_metrics) >= 2:
-        # Create visual comparison charts for available data
-        fig = make_subplots(
-            rows=1, cols=2,
-            subplot_titles=('Average Annual Inflation (%)', 'Average GDP Growth (%)'),
-            specs=[[{"secondary_y": False}, {"secondary_y": False}]]
-        )
-        
-        eras = list(era_metrics.keys())
-        colors = ['orange', 'red'] if len(eras) == 2 else ['green', 'orange', 'red']
-        
-        # Inflation comparison
-        inflation_values = [era_metrics[era]['avg_inflation'] for era in eras]
-        fig.add_trace(
-            go.Bar(x=eras, y=inflation_values, name='Inflation', 
-                   marker_color=colors, text=[f"{v:.1f}%" for v in inflation_values], textposition='auto'),
-            row=1, col=1
-        )
-        
-        # GDP Growth comparison
-        gdp_values = [era_metrics[era]['avg_gdp_growth'] for era in eras]
-        fig.add_trace(
-            go.Bar(x=eras, y=gdp_values, name='GDP Growth', 
-                   marker_color=colors, text=[f"{v:.1f}%" for v in gdp_values], textposition='auto'),
-            row=1, col=2
-        )
-        
-        fig.update_layout(height=600, showlegend=False, 
-                         title_text="Economic Comparison: Gold Standard vs Fiat Currency Eras (FRED Data)")
-        fig.update_xaxes(tickangle=45)
-        st.plotly_chart(fig, use_container_width=True)
+        # Fiat Currency Era (1971-Present) for historical context
+        fiat_start_date, fiat_end_date = plan['fiat'][:2]
+        fiat_metrics = fetch_era_metrics(api_key, fiat_start_date, fiat_end_date)
         
-        # Display comparison table
-        comparison_df = pd.DataFrame(era_metrics).T
-        st.dataframe(comparison_df, use_container_width=True)
-    
-    else:
-        st.warning("⚠️ Insufficient data available for era comparison. Please ensure FRED API access is working properly.")
+        with comparison.container():
+            # Calculate metrics for each era using only available FRED data
+            era_metrics = {}
+            
+            # Gold Standard Era
+            if gold_metrics is not None:
+                era_metrics['Gold Standard (1913-1971)'] = {
+                    'avg_inflation': gold_metrics['avg_inflation'],
+                    'avg_gdp_growth': gold_metrics['avg_gdp_growth'],
+                    'currency_backing': 'Partial Gold',
+                    'monetary_system': 'Central Banking'
+                }
+            
+            # Fiat Currency Era
+            if fiat_metrics is not None:
+                era_metrics['Fiat Currency (1971-Present)'] = {
+                    'avg_inflation': fiat_metrics['avg_inflation'],
+                    'avg_gdp_growth': fiat_metrics['avg_gdp_growth'],
+                    'dollar_purchasing_power_change': -fiat_metrics['purchasing_power_lost'],
+                    'currency_backing': 'None (Fiat)',
+                    'monetary_system': 'Central Bank Monopoly'
+                }
+            
+            # Only create charts if we have data for both eras
+            if len(era_metrics) >= 2:
+                fig_key = figure_key('two_eras_comparison', ERA_SERIES, api_key,
+                                     gold_start_date, fiat_end_date)
+                fig = figure_cache.get(fig_key)
+                if fig is None:
+                    # Create visual comparison charts for available data
+                    fig = make_subplots(
+                        rows=1, cols=2,
+                        subplot_titles=('Average Annual Inflation (%)', 'Average GDP Growth (%)'),
+                        specs=[[{"secondary_y": False}, {"secondary_y": False}]]
+                    )
+                    
+                    eras = list(era_metrics.keys())
+                    colors = ['orange', 'red'] if len(eras) == 2 else ['green', 'orange', 'red']
+                    
+                    # Inflation comparison
+                    inflation_values = [era_metrics[era]['avg_inflation'] for era in eras]
+                    fig.add_trace(
+                        go.Bar(x=eras, y=inflation_values, name='Inflation', 
+                               marker_color=colors, text=[f"{v:.1f}%" for v in inflation_values], textposition='auto'),
+                        row=1, col=1
+                    )
+                    
+                    # GDP Growth comparison
+                    gdp_values = [era_metrics[era]['avg_gdp_growth'] for era in eras]
+                    fig.add_trace(
+                        go.Bar(x=eras, y=gdp_values, name='GDP Growth', 
+                               marker_color=colors, text=[f"{v:.1f}%" for v in gdp_values], textposition='auto'),
+                        row=1, col=2
+                    )
+                    
+                    fig.update_layout(height=600, showlegend=False, 
+                                     title_text="Economic Comparison: Gold Standard vs Fiat Currency Eras (FRED Data)")
+                    fig.update_xaxes(tickangle=45)
+                    fig = figure_cache.put(fig_key, fig)
+                show_chart(fig)
+                
+                # Display comparison table
+                comparison_df = pd.DataFrame(era_metrics).T
+                st.dataframe(comparison_df, use_container_width=True)
+            
+            else:
+                st.warning("⚠️ Insufficient data available for era comparison. Please ensure FRED API access is working properly.")
+    
+    def purchasing_power_chart(page_data):
+        # Dollar purchasing power chart using actual CPI data
+        if 'CPIAUCSL' in page_data['fiat']:
+            with purchasing_power.container():
+                st.subheader("💵 Dollar Purchasing Power Decline (Based on CPI Data)")
+                
+                render_chart(page, plan, 'two_eras_purchasing_power', api_key)
     
-    # Dollar purchasing power chart using actual CPI data
-    if 'CPIAUCSL' in fiat_era_data:
-        st.subheader("💵 Dollar Purchasing Power Decline (Based on CPI Data)")
-        
-        cpi_data = fiat_era_data['CPIAUCSL'].set_index('date')
-        first_cpi = cpi_data['CPIAUCSL'].iloc[0]
-        cpi_data['purchasing_power'] = first_cpi / cpi_data['CPIAUCSL']
-        
-        fig_power = go.Figure()
-        fig_power.add_trace(go.Scatter(
-            x=cpi_data.index,
-            y=cpi_data['purchasing_power'],
-            mode='lines',
-            name='Dollar Purchasing Power',
-            line=dict(color='red', width=3),
-            fill='tonexty'
-        ))
-        
-        first_date = cpi_data.index[0].strftime('%Y')
-        fig_power.update_layout(
-            title=f"💀 Dollar Purchasing Power Decline Since {first_date} (Fiat Era)",
-            xaxis_title="Year",
-            yaxis_title=f"Purchasing Power ({first_date} = 1.00)",
-            height=500
-        )
-        
-        st.plotly_chart(fig_power, use_container_width=True)
+    with st.spinner("Loading comparative economic data..."):
+        # Fetch both eras in one batch, drawing each section as soon as its series arrive
+        fetch_page(plan, api_key, page.series_loads(), [
+            (ERA_SERIES, era_comparison),
+            (['CPIAUCSL'], purchasing_power_chart),
+        ])
+
+# Render the selected page
+PAGE_VIEWS = {
+    "Complete Analysis": complete_analysis,
+    "Fiscal Policy Deep Dive": fiscal_policy,
+    "Monetary Policy Exposure": monetary_policy,
+    "Dollar Debasement Tracker": dollar_debasement,
+    "Bretton Woods Era (1913-1971)": bretton_woods_era,
+    "Fiat Currency Era (Post-1971)": fiat_currency_era,
+    "Two Eras Comparison: Dollar Value & Economic Impact": two_eras_comparison,
+}
+PAGE_VIEWS[analysis_type]()
 
 # Footer with Ron Paul quotes and dedication
 st.markdown("---")
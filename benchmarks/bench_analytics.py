@@ -0,0 +1,61 @@
+"""Micro-benchmark: the dashboard's page computations, run headless on synthetic histories
+
+Runs every computation the pages draw from, without Streamlit or FRED. Run
+from the repository root:
+
+    python benchmarks/bench_analytics.py
+"""
+
+import os
+import sys
+import timeit
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from fed_analysis.analytics import (  # noqa: E402
+    correlation_matrix, debt_to_gdp, decade_inflation, purchasing_power
+)
+
+
+def make_frame(series_id, start, periods, freq, level, seed):
+    """Build a growing random-walk series, named after its series id like the pages' frames"""
+    dates = pd.date_range(start, periods=periods, freq=freq)
+    steps = np.random.default_rng(seed).normal(0.002, 0.01, periods)
+    return pd.DataFrame({'date': dates, series_id: level * np.exp(np.cumsum(steps))})
+
+
+def make_frames():
+    """CPI since 1947, M2 and Fed funds monthly, GDP and debt quarterly, DGS10 daily since 1962"""
+    return {
+        'CPIAUCSL': make_frame('CPIAUCSL', '1947-01-01', 945, 'MS', 21.5, 0),
+        'M2SL': make_frame('M2SL', '1959-01-01', 801, 'MS', 286.6, 1),
+        'FEDFUNDS': make_frame('FEDFUNDS', '1954-07-01', 855, 'MS', 0.8, 2),
+        'GDP': make_frame('GDP', '1947-01-01', 315, 'QS', 243.2, 3),
+        'FYGFDPUN': make_frame('FYGFDPUN', '1970-01-01', 227, 'QS', 283.2, 4),
+        'DGS10': make_frame('DGS10', '1962-01-02', 16700, 'B', 4.1, 5),
+    }
+
+
+def best_ms(func, number=20, repeat=5):
+    return min(timeit.repeat(func, number=number, repeat=repeat)) / number * 1000
+
+
+def main():
+    frames = make_frames()
+    cpi = frames['CPIAUCSL']
+    cases = [
+        ('correlation matrix, 6 series incl. daily', lambda: correlation_matrix(frames)),
+        ('debt-to-GDP, quarterly', lambda: debt_to_gdp({k: frames[k] for k in ('FYGFDPUN', 'GDP')})),
+        ('purchasing power, monthly CPI', lambda: purchasing_power(cpi['CPIAUCSL'])),
+        ('decade inflation, monthly CPI', lambda: decade_inflation(cpi['date'], cpi['CPIAUCSL'])),
+    ]
+    print(f"{'computation':<44}{'ms':>8}")
+    for label, func in cases:
+        print(f"{label:<44}{best_ms(func):>8.2f}")
+
+
+if __name__ == '__main__':
+    main()
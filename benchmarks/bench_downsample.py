@@ -0,0 +1,52 @@
+"""Micro-benchmark: figure JSON size and build time with and without LTTB downsampling
+
+Run from the repository root:
+
+    python benchmarks/bench_downsample.py
+"""
+
+import os
+import sys
+import timeit
+
+import numpy as np
+import pandas as pd
+import plotly.graph_objects as go
+from plotly.subplots import make_subplots
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from fed_analysis.downsample import downsample_figure  # noqa: E402
+
+
+def make_figure(n_observations, subplots):
+    """Build a figure with one daily random-walk trace per subplot, like DGS10 since 1962"""
+    dates = pd.bdate_range('1962-01-02', periods=n_observations)
+    values = 4 + np.cumsum(np.random.default_rng(0).normal(0, 0.05, n_observations))
+    rows = cols = 2 if subplots else 1
+    fig = make_subplots(rows=rows, cols=cols)
+    for row in range(1, rows + 1):
+        for col in range(1, cols + 1):
+            fig.add_trace(go.Scatter(x=dates, y=values, mode='lines'), row=row, col=col)
+    return fig
+
+
+def main():
+    cases = [
+        ('daily, 1962-present, single chart', 16700, False),
+        ('daily, 1962-present, 2x2 subplots', 16700, True),
+        ('daily, 4x DGS10, 2x2 subplots', 66800, True),
+    ]
+    print(f"{'figure':<38}{'full KB':>10}{'LTTB KB':>10}{'ratio':>8}{'LTTB ms':>10}")
+    for label, n_observations, subplots in cases:
+        full_kb = len(make_figure(n_observations, subplots).to_json()) / 1024
+        reduced_kb = len(downsample_figure(make_figure(n_observations, subplots)).to_json()) / 1024
+
+        figures = [make_figure(n_observations, subplots) for _ in range(5)]
+        seconds = timeit.timeit(lambda: downsample_figure(figures.pop()), number=5)
+        print(f"{label:<38}{full_kb:>10.0f}{reduced_kb:>10.0f}{full_kb / reduced_kb:>7.1f}x"
+              f"{seconds / 5 * 1000:>10.1f}")
+
+
+if __name__ == '__main__':
+    main()
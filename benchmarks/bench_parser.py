@@ -0,0 +1,74 @@
+"""Micro-benchmark: vectorized FRED observation parser vs the original pandas path
+
+Run from the repository root:
+
+    python benchmarks/bench_parser.py
+"""
+
+import json
+import os
+import sys
+import timeit
+from datetime import date, timedelta
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from fed_analysis.parser import parse_observations  # noqa: E402
+
+
+def make_payload(n_observations, start=date(1962, 1, 2), step=timedelta(days=1)):
+    """Build a FRED-shaped observations payload, with roughly 1 in 20 values missing like DGS10"""
+    observations = []
+    day = start
+    for i in range(n_observations):
+        observations.append({
+            'realtime_start': '2026-10-16',
+            'realtime_end': '2026-10-16',
+            'date': day.isoformat(),
+            'value': '.' if i % 20 == 0 else f"{2 + (i % 500) / 100:.2f}"
+        })
+        day += step
+    body = {'count': n_observations, 'offset': 0, 'limit': 100000, 'observations': observations}
+    return json.dumps(body, separators=(',', ':')).encode()
+
+
+def parse_legacy(payload):
+    """The parse previously done inline in fetch_fred_data"""
+    data = json.loads(payload)
+    df = pd.DataFrame(data['observations'])
+    df = df[df['value'] != '.'].copy()
+    df['value'] = pd.to_numeric(df['value'])
+    df['date'] = pd.to_datetime(df['date'])
+    return df[['date', 'value']]
+
+
+def best_ms(func, payload, number=20, repeat=5):
+    return min(timeit.repeat(lambda: func(payload), number=number, repeat=repeat)) / number * 1000
+
+
+def main():
+    cases = [
+        ('monthly, 1913-present (CPIAUCSL)', 1354),
+        ('daily, 1962-present (DGS10)', 16700),
+        ('daily, 4x DGS10', 66800),
+    ]
+    print(f"{'payload':<36}{'legacy ms':>12}{'vectorized ms':>16}{'speedup':>10}")
+    for label, n_observations in cases:
+        payload = make_payload(n_observations)
+
+        legacy = parse_legacy(payload)
+        dates, values = parse_observations(payload)
+        present = ~np.isnan(values)
+        assert np.array_equal(legacy['date'].to_numpy().astype('datetime64[D]'), dates[present])
+        assert np.allclose(legacy['value'].to_numpy(), values[present])
+
+        legacy_ms = best_ms(parse_legacy, payload)
+        vectorized_ms = best_ms(parse_observations, payload)
+        print(f"{label:<36}{legacy_ms:>12.2f}{vectorized_ms:>16.2f}{legacy_ms / vectorized_ms:>9.1f}x")
+
+
+if __name__ == '__main__':
+    main()
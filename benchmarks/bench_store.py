@@ -0,0 +1,55 @@
+"""Micro-benchmark: reading a stored history from SQLite rows vs mapping its .npy files
+
+Loads each series the way a restarted worker does, in a temporary store.
+Run from the repository root:
+
+    python benchmarks/bench_store.py
+"""
+
+import os
+import sys
+import tempfile
+import timeit
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from fed_analysis.store import SeriesStore  # noqa: E402
+
+
+def make_series(n_observations, step_days):
+    """Dates every step_days from 1913 with a random-walk value, roughly 1 in 20 missing like DGS10"""
+    dates = np.datetime64('1913-01-01') + np.arange(n_observations) * step_days
+    values = 2 + np.cumsum(np.random.default_rng(0).normal(0, 0.05, n_observations))
+    values[::20] = np.nan
+    return dates.astype('datetime64[D]'), values
+
+
+def best_ms(func, number=20, repeat=5):
+    return min(timeit.repeat(func, number=number, repeat=repeat)) / number * 1000
+
+
+def main():
+    cases = [
+        ('monthly, 1913-present (CPIAUCSL)', 'CPIAUCSL', 1354, 30),
+        ('daily, 1962-present (DGS10)', 'DGS10', 16700, 1),
+        ('daily, 4x DGS10', 'DAILY4X', 66800, 1),
+    ]
+    with tempfile.TemporaryDirectory() as cache_dir:
+        store = SeriesStore(cache_dir)
+        print(f"{'series':<36}{'sqlite ms':>12}{'npy mmap ms':>14}{'speedup':>10}")
+        for label, series_id, n_observations, step_days in cases:
+            store.append(series_id, *make_series(n_observations, step_days))
+
+            dates, values = store.history(series_id)
+            stored_dates, stored_values = store.read(series_id)
+            assert np.array_equal(dates, stored_dates) and np.array_equal(values, stored_values)
+
+            sqlite_ms = best_ms(lambda: store.read(series_id))
+            mmap_ms = best_ms(lambda: store.history(series_id))
+            print(f"{label:<36}{sqlite_ms:>12.2f}{mmap_ms:>14.2f}{sqlite_ms / mmap_ms:>9.1f}x")
+
+
+if __name__ == '__main__':
+    main()
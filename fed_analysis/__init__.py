@@ -0,0 +1,88 @@
+"""Data and analytics layer of the Federal Reserve Analysis Dashboard apps, importable without Streamlit"""
+
+from fed_analysis.analytics import (
+    correlation_matrix, debt_to_gdp, decade_inflation, latest_value, load_frames, named_frames,
+    purchasing_power, purchasing_power_lost
+)
+from fed_analysis.buckets import (
+    BUCKET_SETS, DECADES, FED_CHAIRS, NBER_RECESSIONS, PRESIDENTIAL_TERMS, BucketSet
+)
+from fed_analysis.cache import SeriesCache, get_cache, load_many, load_series
+from fed_analysis.client import CircuitOpenError, FredClient, get_client
+from fed_analysis.downsample import CHART_WIDTH, downsample_figure, lttb
+from fed_analysis.eras import (
+    ERA_SERIES, FED_CREATION, NIXON_SHOCK, compute_era_metrics, load_era_metrics
+)
+from fed_analysis.figures import FigureCache, data_version, figure_size, get_figure_cache
+from fed_analysis.fred import fetch_observations, fetch_series_info, refresh_series
+from fed_analysis.metrics import change_over, compute_series_metrics, series_metrics
+from fed_analysis.pages import (
+    PREVIEW_AFTER, SELECTED, Chart, Line, PageSpec, Panel, SubplotChart, iter_plan, load_plan,
+    plan_series
+)
+from fed_analysis.panel import SeriesPanel, infer_frequency
+from fed_analysis.parser import parse_observations
+from fed_analysis.pyramid import SeriesPyramid
+from fed_analysis.store import SeriesStore, get_store
+from fed_analysis.themes import DEFAULT_THEME, THEMES, resolve_theme
+
+__all__ = [
+    'BUCKET_SETS',
+    'BucketSet',
+    'CHART_WIDTH',
+    'Chart',
+    'CircuitOpenError',
+    'DECADES',
+    'DEFAULT_THEME',
+    'ERA_SERIES',
+    'FED_CHAIRS',
+    'FED_CREATION',
+    'FigureCache',
+    'FredClient',
+    'Line',
+    'NBER_RECESSIONS',
+    'NIXON_SHOCK',
+    'PRESIDENTIAL_TERMS',
+    'PREVIEW_AFTER',
+    'PageSpec',
+    'Panel',
+    'SELECTED',
+    'SeriesCache',
+    'SeriesPanel',
+    'SeriesPyramid',
+    'SeriesStore',
+    'SubplotChart',
+    'THEMES',
+    'change_over',
+    'compute_era_metrics',
+    'compute_series_metrics',
+    'correlation_matrix',
+    'data_version',
+    'debt_to_gdp',
+    'decade_inflation',
+    'downsample_figure',
+    'fetch_observations',
+    'fetch_series_info',
+    'figure_size',
+    'get_cache',
+    'get_client',
+    'get_figure_cache',
+    'get_store',
+    'infer_frequency',
+    'iter_plan',
+    'latest_value',
+    'load_era_metrics',
+    'load_frames',
+    'load_many',
+    'load_plan',
+    'load_series',
+    'lttb',
+    'named_frames',
+    'parse_observations',
+    'plan_series',
+    'purchasing_power',
+    'purchasing_power_lost',
+    'refresh_series',
+    'resolve_theme',
+    'series_metrics',
+]
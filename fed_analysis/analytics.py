@@ -0,0 +1,86 @@
+"""The dashboard's page computations as plain functions, runnable without Streamlit
+
+Frames follow the rest of the package: a 'date' column and one value column,
+named either 'value' (as loaded) or after the series. Each computation takes
+frames or arrays and returns arrays or DataFrames, so batch jobs, benchmarks
+and worker processes get the same numbers as the pages.
+"""
+
+import numpy as np
+
+from fed_analysis.buckets import DECADES
+from fed_analysis.cache import MAX_FETCH_WORKERS, load_many
+from fed_analysis.metrics import compute_series_metrics
+from fed_analysis.panel import SeriesPanel, infer_frequency
+
+
+def named_frames(frames):
+    """Name the value column of each frame after its series, dropping empty frames"""
+    return {
+        series_id: df.rename(columns={'value': series_id})
+        for series_id, df in frames.items()
+        if not df.empty
+    }
+
+
+def load_frames(series_ids, api_key, start_date=None, end_date=None, max_points=None,
+                max_workers=MAX_FETCH_WORKERS):
+    """Load several series concurrently, as frames with value columns named after their series
+
+    Returns the non-empty frames keyed by series id and a dict of the
+    exceptions raised by any series that failed to load (see load_many).
+    """
+    data, errors = load_many(series_ids, api_key, start_date, end_date, max_points, max_workers)
+    return named_frames(data), errors
+
+
+def latest_value(values):
+    """Return the last observation that is not NaN, or None when there is none"""
+    values = np.asarray(values, dtype=np.float64)
+    present = values[~np.isnan(values)]
+    return present[-1] if len(present) else None
+
+
+def correlation_matrix(frames):
+    """Correlate several series on the finest calendar they all share
+
+    Daily, monthly and quarterly series are aligned first (quarterly with GDP
+    in the mix), so the correlations compare matching periods.
+    """
+    return SeriesPanel.from_frames(frames).aligned().corr()
+
+
+def debt_to_gdp(frames):
+    """Federal debt (FYGFDPUN) as a percentage of GDP, on one quarterly calendar
+
+    Returns a frame indexed by quarter with the FYGFDPUN, GDP and debt_to_gdp
+    columns, holding only the quarters where both series have a value.
+    """
+    combined = SeriesPanel.from_frames(frames).aligned('Q')[['FYGFDPUN', 'GDP']].dropna()
+    combined['debt_to_gdp'] = (combined['FYGFDPUN'] / combined['GDP']) * 100
+    return combined
+
+
+def purchasing_power(cpi):
+    """Purchasing power of the dollar at each CPI observation, relative to the first (1.00)"""
+    cpi = np.asarray(cpi, dtype=np.float64)
+    return cpi[0] / cpi
+
+
+def purchasing_power_lost(first_cpi, last_cpi):
+    """Percentage of the dollar's purchasing power lost between two CPI levels"""
+    return (1 - (first_cpi / last_cpi)) * 100
+
+
+def decade_inflation(dates, cpi):
+    """Average year-over-year CPI inflation per calendar decade
+
+    Year-over-year inflation is computed once over the whole CPI window, then
+    every observation is bucketed by decade in a single pass. Returns a frame
+    with decade, start, end, avg_inflation and count columns for the decades
+    holding data.
+    """
+    dates = np.asarray(dates, dtype='datetime64[D]')
+    cpi = np.asarray(cpi, dtype=np.float64)
+    yoy = compute_series_metrics(dates, cpi, infer_frequency(dates))['yoy']
+    return DECADES.aggregate(dates, yoy, 'mean').rename(columns={'label': 'decade', 'value': 'avg_inflation'})
@@ -0,0 +1,163 @@
+"""Period-bucket aggregation: decades, Fed chairs, presidencies, recessions"""
+
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+
+OPEN_END = np.datetime64('9999-12-31', 'D')
+
+REDUCTIONS = ('mean', 'sum', 'count', 'min', 'max', 'first', 'last', 'change')
+
+
+class BucketSet:
+    """Named, non-overlapping date intervals that observations are grouped into
+
+    Buckets are sorted by start date and may leave gaps (recessions do); an
+    observation falling in a gap belongs to no bucket. Every observation is
+    assigned with one searchsorted over the bucket starts, so grouping a
+    series costs O(n log buckets) however many buckets there are.
+    """
+
+    def __init__(self, name, labels, starts, ends):
+        order = np.argsort(np.asarray(starts, dtype='datetime64[D]'))
+        self.name = name
+        self.labels = [labels[i] for i in order]
+        self.starts = np.asarray(starts, dtype='datetime64[D]')[order]
+        self.ends = np.asarray(ends, dtype='datetime64[D]')[order]
+
+    @classmethod
+    def contiguous(cls, name, labels, starts, last_end=None):
+        """Build buckets that each run until the day before the next one starts"""
+        starts = np.asarray(starts, dtype='datetime64[D]')
+        ends = np.append(starts[1:] - np.timedelta64(1, 'D'),
+                         np.datetime64(last_end, 'D') if last_end else OPEN_END)
+        return cls(name, labels, starts, ends)
+
+    def __len__(self):
+        return len(self.labels)
+
+    def assign(self, dates):
+        """Return the bucket index of each date, or -1 for dates outside every bucket"""
+        dates = np.asarray(dates, dtype='datetime64[D]')
+        index = np.searchsorted(self.starts, dates, 'right') - 1
+        inside = index >= 0
+        inside[inside] = dates[inside] <= self.ends[index[inside]]
+        return np.where(inside, index, -1)
+
+    def aggregate(self, dates, values, how='mean'):
+        """Reduce a series per bucket, skipping NaN values
+
+        ``how`` is one of REDUCTIONS; 'change' is the percent change from the
+        first to the last value in the bucket. Returns a frame with label,
+        start, end, value and count columns for the buckets holding data.
+        """
+        return self.aggregate_many(dates, {'value': values}, how)
+
+    def aggregate_many(self, dates, columns, how='mean'):
+        """Reduce several value arrays sharing the same dates, assigning buckets only once"""
+        if how not in REDUCTIONS:
+            raise ValueError(f"Unknown reduction {how!r}; expected one of {', '.join(REDUCTIONS)}")
+
+        index = self.assign(dates)
+        result = {}
+        counts = np.zeros(len(self), dtype=np.int64)
+        for column, values in columns.items():
+            values = np.asarray(values, dtype=np.float64)
+            valid = (index >= 0) & ~np.isnan(values)
+            result[column], column_counts = _reduce(index[valid], values[valid], len(self), how)
+            counts = np.maximum(counts, column_counts)
+
+        keep = counts > 0
+        frame = pd.DataFrame({
+            'label': np.asarray(self.labels, dtype=object)[keep],
+            'start': self.starts[keep],
+            'end': np.where(self.ends == OPEN_END, np.datetime64('NaT'), self.ends)[keep],
+        })
+        for column, reduced in result.items():
+            frame[column] = reduced[keep]
+        frame['count'] = counts[keep]
+        return frame
+
+
+def _reduce(index, values, n_buckets, how):
+    """Grouped reduction of values already restricted to valid observations, in date order"""
+    counts = np.bincount(index, minlength=n_buckets)
+    reduced = np.full(n_buckets, np.nan)
+    present = counts > 0
+
+    if how == 'count':
+        reduced = counts.astype(np.float64)
+    elif how in ('sum', 'mean'):
+        sums = np.bincount(index, weights=values, minlength=n_buckets)
+        reduced[present] = sums[present] / counts[present] if how == 'mean' else sums[present]
+    elif how == 'min':
+        np.fmin.at(reduced, index, values)
+    elif how == 'max':
+        np.fmax.at(reduced, index, values)
+    else:
+        # Observations are in date order, so a bucket's first and last values sit at the
+        # first and last positions of its run of indices
+        buckets, first_pos = np.unique(index, return_index=True)
+        last_pos = len(index) - 1 - np.unique(index[::-1], return_index=True)[1]
+        first, last = np.full(n_buckets, np.nan), np.full(n_buckets, np.nan)
+        first[buckets], last[buckets] = values[first_pos], values[last_pos]
+        reduced = {'first': first, 'last': last, 'change': (last / first - 1) * 100}[how]
+    return reduced, counts
+
+
+def decade_buckets(first_year=1910, last_year=None):
+    """Build one bucket per calendar decade, labelled like '1970s'"""
+    last_year = last_year or datetime.now().year
+    decades = range(first_year - first_year % 10, last_year + 1, 10)
+    return BucketSet.contiguous(
+        'Decade', [f"{decade}s" for decade in decades], [f"{decade}-01-01" for decade in decades],
+        last_end=f"{decades[-1] + 9}-12-31"
+    )
+
+
+DECADES = decade_buckets()
+
+FED_CHAIRS = BucketSet.contiguous('Fed Chair', [
+    'Hamlin', 'Harding', 'Crissinger', 'Young', 'Meyer', 'Black', 'Eccles', 'McCabe',
+    'Martin', 'Burns', 'Miller', 'Volcker', 'Greenspan', 'Bernanke', 'Yellen', 'Powell',
+], [
+    '1914-08-10', '1916-08-10', '1923-05-01', '1927-10-04', '1930-09-16', '1933-05-19',
+    '1934-11-15', '1948-04-15', '1951-04-02', '1970-02-01', '1978-03-08', '1979-08-06',
+    '1987-08-11', '2006-02-01', '2014-02-03', '2018-02-05',
+])
+
+PRESIDENTIAL_TERMS = BucketSet.contiguous('President', [
+    'Wilson', 'Harding', 'Coolidge', 'Hoover', 'F. Roosevelt', 'Truman', 'Eisenhower',
+    'Kennedy', 'L. Johnson', 'Nixon', 'Ford', 'Carter', 'Reagan', 'G. H. W. Bush',
+    'Clinton', 'G. W. Bush', 'Obama', 'Trump (1st term)', 'Biden', 'Trump (2nd term)',
+], [
+    '1913-03-04', '1921-03-04', '1923-08-02', '1929-03-04', '1933-03-04', '1945-04-12',
+    '1953-01-20', '1961-01-20', '1963-11-22', '1969-01-20', '1974-08-09', '1977-01-20',
+    '1981-01-20', '1989-01-20', '1993-01-20', '2001-01-20', '2009-01-20', '2017-01-20',
+    '2021-01-20', '2025-01-20',
+])
+
+# NBER business cycle peaks and troughs (from the first day of the peak month to the
+# last day of the trough month)
+_RECESSION_MONTHS = [
+    ('1913-01', '1914-12'), ('1918-08', '1919-03'), ('1920-01', '1921-07'), ('1923-05', '1924-07'),
+    ('1926-10', '1927-11'), ('1929-08', '1933-03'), ('1937-05', '1938-06'), ('1945-02', '1945-10'),
+    ('1948-11', '1949-10'), ('1953-07', '1954-05'), ('1957-08', '1958-04'), ('1960-04', '1961-02'),
+    ('1969-12', '1970-11'), ('1973-11', '1975-03'), ('1980-01', '1980-07'), ('1981-07', '1982-11'),
+    ('1990-07', '1991-03'), ('2001-03', '2001-11'), ('2007-12', '2009-06'), ('2020-02', '2020-04'),
+]
+
+NBER_RECESSIONS = BucketSet(
+    'Recession',
+    [f"{peak} to {trough}" for peak, trough in _RECESSION_MONTHS],
+    [np.datetime64(peak, 'M').astype('datetime64[D]') for peak, _ in _RECESSION_MONTHS],
+    [(np.datetime64(trough, 'M') + 1).astype('datetime64[D]') - 1 for _, trough in _RECESSION_MONTHS],
+)
+
+BUCKET_SETS = {
+    'Decades': DECADES,
+    'Fed Chairs': FED_CHAIRS,
+    'Presidential Terms': PRESIDENTIAL_TERMS,
+    'NBER Recessions': NBER_RECESSIONS,
+}
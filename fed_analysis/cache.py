@@ -0,0 +1,344 @@
+"""In-memory cache of full series histories, answering any date window by slicing"""
+
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+
+from fed_analysis.fred import REVISION_HORIZON, refresh_series
+from fed_analysis.panel import infer_frequency
+from fed_analysis.pyramid import SeriesPyramid
+from fed_analysis.store import get_store
+
+# How long a cached history is served as fresh before a background refresh is started
+SERIES_TTL = 3600
+
+# Beyond this age a stale history is no longer served and callers wait for the refresh
+SERIES_MAX_STALENESS = int(os.getenv('FRED_MAX_STALENESS', 24 * 3600))
+
+# Upper bound on concurrent FRED requests issued by a single batch load
+MAX_FETCH_WORKERS = 8
+
+# Threads refreshing expired series behind the scenes
+REFRESH_WORKERS = 2
+
+# How long a failed load is remembered before FRED is asked again
+NEGATIVE_TTL = 60
+
+# Bound on pinned windows of closed history; the fixed era windows are read on every visit
+# of their pages, so only windows picked once (custom ranges) are evicted
+MAX_PINNED_WINDOWS = 256
+
+# FRED frequency_short codes mapped onto the panel's frequency codes
+FRED_FREQUENCIES = {'D': 'D', 'W': 'W', 'BW': 'W', 'M': 'M', 'Q': 'Q', 'SA': 'A', 'A': 'A'}
+
+logger = logging.getLogger(__name__)
+
+
+def is_closed_window(end_date):
+    """Whether a window ending on end_date ('YYYY-MM-DD' or None for today) lies in settled history"""
+    return bool(end_date) and datetime.strptime(end_date, '%Y-%m-%d') < datetime.now() - REVISION_HORIZON
+
+
+def read_only(array):
+    """Mark an array non-writeable, so it can be shared by every session without copies"""
+    array.flags.writeable = False
+    return array
+
+
+class CachedSeries:
+    """Full history of one series held as sorted date and value arrays
+
+    The arrays are read-only and shared by every session; histories read from
+    the store are memory-mapped from its files, and so shared by every worker
+    process as well. Windows are handed out as views of one frame over the
+    whole history, without copying; pandas copies a window's data only when a
+    page writes into it (copy-on-write), while adding columns to a window
+    leaves the shared data untouched.
+    """
+
+    def __init__(self, dates, values, meta=None, loaded_at=None):
+        self.dates = read_only(dates)
+        self.values = read_only(values)
+        self.meta = meta or {}
+        self.loaded_at = time.time() if loaded_at is None else loaded_at
+        self._pyramid = None
+        self._frame = None
+
+    def age(self):
+        return time.time() - self.loaded_at
+
+    @property
+    def version(self):
+        """Identifies the data held, so results derived from it can be memoized across reruns"""
+        last_date = str(self.dates[-1]) if len(self.dates) else None
+        return (self.meta.get('last_updated'), len(self.dates), last_date)
+
+    @property
+    def frequency(self):
+        """Native frequency code ('D', 'W', 'M', 'Q' or 'A'), from FRED metadata when available"""
+        frequency = FRED_FREQUENCIES.get(self.meta.get('frequency_short'))
+        return frequency or infer_frequency(self.dates)
+
+    @property
+    def pyramid(self):
+        """Min/max/last summaries of the history, built on first use and kept with the entry"""
+        if self._pyramid is None:
+            self._pyramid = SeriesPyramid(self.values)
+        return self._pyramid
+
+    @property
+    def frame(self):
+        """The whole history as a date/value frame backed by the shared arrays, built on first use"""
+        if self._frame is None:
+            # Frames hold dates at second resolution; the converted dates are made once here
+            # and the values are wrapped as they are
+            dates = read_only(self.dates.astype('datetime64[s]'))
+            self._frame = pd.DataFrame({'date': dates, 'value': self.values}, copy=False)
+        return self._frame
+
+    def bounds(self, start_date=None, end_date=None):
+        """Return the index range [lo, hi) of observations between two inclusive 'YYYY-MM-DD' dates"""
+        lo = np.searchsorted(self.dates, np.datetime64(start_date), 'left') if start_date else 0
+        hi = np.searchsorted(self.dates, np.datetime64(end_date), 'right') if end_date else len(self.dates)
+        return lo, hi
+
+    def window(self, start_date=None, end_date=None, max_points=None):
+        """Return observations between two inclusive 'YYYY-MM-DD' dates as a frame
+
+        The frame is a zero-copy view of the shared history. With
+        ``max_points``, a longer window is summarized from the pyramid by the
+        minimum, maximum and last observation of each of its buckets.
+        """
+        lo, hi = self.bounds(start_date, end_date)
+        if max_points is None or hi - lo <= max_points:
+            return self.frame.iloc[lo:hi].reset_index(drop=True)
+        positions = self.pyramid.select(lo, hi, max_points)
+        return self.frame.take(positions).reset_index(drop=True)
+
+    def subset(self, start_date=None, end_date=None):
+        """Return a detached copy holding only the observations of a date window"""
+        lo, hi = self.bounds(start_date, end_date)
+        return CachedSeries(self.dates[lo:hi].copy(), self.values[lo:hi].copy(), self.meta, self.loaded_at)
+
+
+class SeriesCache:
+    """Holds each series once at maximum extent, whatever date windows pages ask for
+
+    Cache entries are keyed by series id alone, so switching between time
+    periods (or crossing midnight, which moves every 'today' end date) is
+    answered from memory without touching the network.
+
+    Entries older than ``ttl`` are served stale while a background worker
+    refreshes them; the new history replaces the old one in a single dict
+    assignment, so the next rerun picks it up. Only entries older than
+    ``max_staleness`` (or never loaded) make the caller wait on the network.
+
+    Windows of closed history (see is_closed_window), such as the 1913-1971
+    gold era, are pinned the first time they are read and served from then on
+    without any expiry or refresh. At most ``max_pinned`` windows are kept,
+    the least recently read evicted first.
+
+    A failed load is remembered for ``negative_ttl`` seconds. Until then, the
+    series' last good copy is served whatever its age, and a series with no
+    copy re-raises the failure at once instead of hitting FRED again.
+
+    Worker processes sharing a store also share its refreshes. A refresh runs
+    under the store's per-series lock, and a worker finding that another one
+    refreshed the series less than ``ttl`` ago reads that result from the
+    store instead of asking FRED. Each series is then fetched about once per
+    ``ttl``, however many workers serve it.
+    """
+
+    def __init__(self, store=None, ttl=SERIES_TTL, max_staleness=SERIES_MAX_STALENESS,
+                 negative_ttl=NEGATIVE_TTL, max_pinned=MAX_PINNED_WINDOWS):
+        self.store = store or get_store()
+        self.ttl = ttl
+        self.max_staleness = max_staleness
+        self.negative_ttl = negative_ttl
+        self.max_pinned = max_pinned
+        self._entries = {}
+        self._inflight = {}
+        self._failures = {}
+        self._pinned = OrderedDict()
+        self._lock = threading.Lock()
+        self._refresher = ThreadPoolExecutor(max_workers=REFRESH_WORKERS, thread_name_prefix='fred-refresh')
+
+    def _is_fresh(self, entry):
+        return entry is not None and entry.age() < self.ttl
+
+    def _is_servable(self, entry):
+        return entry is not None and entry.age() < self.max_staleness
+
+    def _recent_failure(self, series_id):
+        with self._lock:
+            failure = self._failures.get(series_id)
+        if failure is not None and time.time() - failure[1] < self.negative_ttl:
+            return failure[0]
+        return None
+
+    def _begin_refresh(self, series_id):
+        """Claim the refresh of a series; returns its future and whether this caller must run it"""
+        # Single flight: the first caller for an expired series performs the fetch and
+        # every concurrent caller, from any session, waits on the same future
+        with self._lock:
+            future = self._inflight.get(series_id)
+            if future is not None:
+                return future, False
+            future = self._inflight[series_id] = Future()
+            return future, True
+
+    def _run_refresh(self, series_id, api_key, future):
+        try:
+            with self.store.refresh_lock(series_id):
+                # Another worker may have refreshed the series while this one waited for the
+                # lock or since it last read the store; its fetch is then reused as it is
+                fetched_at = self.store.fetched_at(series_id)
+                if fetched_at is None or time.time() - fetched_at >= self.ttl:
+                    refresh_series(series_id, api_key, self.store)
+                    fetched_at = None
+                entry = self._read_store(series_id, fetched_at)
+        except BaseException as e:
+            with self._lock:
+                self._failures[series_id] = (e, time.time())
+                del self._inflight[series_id]
+            future.set_exception(e)
+            raise
+
+        with self._lock:
+            self._entries[series_id] = entry
+            self._failures.pop(series_id, None)
+            del self._inflight[series_id]
+        future.set_result(entry)
+        return entry
+
+    def _background_refresh(self, series_id, api_key, future):
+        try:
+            self._run_refresh(series_id, api_key, future)
+        except Exception as e:
+            logger.warning("Background refresh of %s failed (%s); serving the last good copy", series_id, e)
+
+    def _load(self, series_id, api_key):
+        with self._lock:
+            entry = self._entries.get(series_id)
+        if entry is None:
+            # After a restart, serve whatever the on-disk store holds, aged by its last fetch
+            entry = self._seed_from_store(series_id)
+        if self._is_fresh(entry):
+            return entry
+
+        failure = self._recent_failure(series_id)
+        if failure is not None:
+            if entry is not None:
+                return entry
+            raise failure
+
+        future, leader = self._begin_refresh(series_id)
+        if self._is_servable(entry):
+            if leader:
+                self._refresher.submit(self._background_refresh, series_id, api_key, future)
+            return entry
+
+        try:
+            if leader:
+                return self._run_refresh(series_id, api_key, future)
+            return future.result()
+        except Exception as e:
+            if entry is None:
+                raise
+            logger.warning("Refresh of %s failed (%s); serving the last good copy", series_id, e)
+            return entry
+
+    def _read_store(self, series_id, loaded_at=None):
+        return CachedSeries(*self.store.history(series_id), meta=self.store.metadata(series_id), loaded_at=loaded_at)
+
+    def _seed_from_store(self, series_id):
+        fetched_at = self.store.fetched_at(series_id)
+        if fetched_at is None:
+            return None
+        entry = self._read_store(series_id, fetched_at)
+        with self._lock:
+            return self._entries.setdefault(series_id, entry)
+
+    def entry(self, series_id, api_key):
+        """Return the full cached history of a series, loading it if not cached or too stale"""
+        return self._load(series_id, api_key)
+
+    def get(self, series_id, api_key, start_date=None, end_date=None, max_points=None):
+        """Return a date window of a series, loading its full history if not cached or too stale"""
+        if not is_closed_window(end_date):
+            return self._load(series_id, api_key).window(start_date, end_date, max_points)
+
+        key = (series_id, start_date, end_date)
+        with self._lock:
+            pinned = self._pinned.get(key)
+            if pinned is not None:
+                self._pinned.move_to_end(key)
+        if pinned is None:
+            pinned = self._load(series_id, api_key).subset(start_date, end_date)
+            with self._lock:
+                pinned = self._pinned.setdefault(key, pinned)
+                while len(self._pinned) > self.max_pinned:
+                    self._pinned.popitem(last=False)
+        return pinned.window(max_points=max_points)
+
+    def metadata(self, series_id, api_key):
+        """Return the FRED metadata (frequency, units, last_updated, ...) of a series"""
+        return self._load(series_id, api_key).meta
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._pinned.clear()
+            self._failures.clear()
+
+
+_default_cache = None
+_default_cache_lock = threading.Lock()
+
+
+def get_cache():
+    """Return the process-wide series cache, creating it on first use"""
+    global _default_cache
+    with _default_cache_lock:
+        if _default_cache is None:
+            _default_cache = SeriesCache()
+        return _default_cache
+
+
+def load_series(series_id, api_key, start_date=None, end_date=None, max_points=None):
+    """Return a date window of a series from the process-wide cache"""
+    return get_cache().get(series_id, api_key, start_date, end_date, max_points)
+
+
+def load_many(series_ids, api_key, start_date=None, end_date=None, max_points=None,
+              max_workers=MAX_FETCH_WORKERS):
+    """Load several series concurrently over a bounded thread pool
+
+    Returns a dict of frames keyed by series id in the requested order, and a
+    dict of the exceptions raised by any series that failed to load. With
+    ``max_points``, long windows come back as pyramid overviews.
+    """
+    series_ids = list(dict.fromkeys(series_ids))
+    data, errors = {}, {}
+    if not series_ids:
+        return data, errors
+
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(series_ids))) as pool:
+        futures = {
+            series_id: pool.submit(load_series, series_id, api_key, start_date, end_date, max_points)
+            for series_id in series_ids
+        }
+
+    for series_id, future in futures.items():
+        try:
+            data[series_id] = future.result()
+        except Exception as e:
+            errors[series_id] = e
+    return data, errors
@@ -0,0 +1,193 @@
+"""Shared HTTP client for the FRED API: pooled connections, timeouts, retries and rate limiting"""
+
+import json
+import random
+import threading
+import time
+
+import requests
+from requests.adapters import HTTPAdapter
+
+FRED_API_ROOT = 'https://api.stlouisfed.org/fred/'
+
+# FRED allows 120 requests per minute per API key
+RATE_LIMIT_PER_MINUTE = 120
+RATE_LIMIT_BURST = 10
+
+# (connect, read) timeouts in seconds for a single request, and the overall
+# budget for one call including retries
+REQUEST_TIMEOUT = (5, 30)
+REQUEST_DEADLINE = 90
+
+MAX_RETRIES = 4
+BACKOFF_BASE = 0.5
+BACKOFF_MAX = 20
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+POOL_SIZE = 16
+
+# Consecutive failed calls that open an endpoint's circuit, and how long it stays open
+BREAKER_FAILURE_THRESHOLD = 3
+BREAKER_RESET_TIMEOUT = 60
+
+
+class CircuitOpenError(requests.RequestException):
+    """Raised without contacting FRED while an endpoint's circuit breaker is open"""
+
+
+class TokenBucket:
+    """Thread-safe token bucket; acquire() blocks until a token is available"""
+
+    def __init__(self, rate, capacity):
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self.rate
+            time.sleep(wait)
+
+
+class CircuitBreaker:
+    """Fails calls fast after repeated failures, letting one trial call through per reset timeout"""
+
+    def __init__(self, failure_threshold=BREAKER_FAILURE_THRESHOLD, reset_timeout=BREAKER_RESET_TIMEOUT):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._failures = 0
+        self._opened_at = None
+        self._lock = threading.Lock()
+
+    def before_call(self, name):
+        with self._lock:
+            if self._opened_at is None:
+                return
+            remaining = self.reset_timeout - (time.monotonic() - self._opened_at)
+            if remaining > 0:
+                raise CircuitOpenError(f"FRED {name} is failing; retrying in {remaining:.0f}s")
+            # Half open: this caller makes the trial call while everyone else keeps failing fast
+            self._opened_at = time.monotonic()
+
+    def record_success(self):
+        with self._lock:
+            self._failures = 0
+            self._opened_at = None
+
+    def record_failure(self):
+        with self._lock:
+            self._failures += 1
+            if self._failures >= self.failure_threshold:
+                self._opened_at = time.monotonic()
+
+
+class FredClient:
+    """Pooled, rate-limited FRED client retrying 429/5xx responses with jittered exponential backoff"""
+
+    def __init__(self, rate_limit=RATE_LIMIT_PER_MINUTE, burst=RATE_LIMIT_BURST,
+                 timeout=REQUEST_TIMEOUT, deadline=REQUEST_DEADLINE,
+                 max_retries=MAX_RETRIES, pool_size=POOL_SIZE):
+        self.timeout = timeout
+        self.deadline = deadline
+        self.max_retries = max_retries
+
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size)
+        self.session.mount('https://', adapter)
+
+        # Refill slowly enough that a full burst plus a minute of refill never
+        # exceeds the per-minute limit in any 60 second window
+        self.bucket = TokenBucket((rate_limit - burst) / 60, burst)
+
+        self._breakers = {}
+        self._breakers_lock = threading.Lock()
+
+    def breaker(self, path):
+        """Return the circuit breaker guarding one endpoint"""
+        with self._breakers_lock:
+            if path not in self._breakers:
+                self._breakers[path] = CircuitBreaker()
+            return self._breakers[path]
+
+    def _backoff(self, attempt, response=None):
+        if response is not None and response.headers.get('Retry-After', '').isdigit():
+            return float(response.headers['Retry-After'])
+        return random.uniform(0, min(BACKOFF_MAX, BACKOFF_BASE * 2 ** attempt))
+
+    def get_content(self, path, params):
+        """GET a FRED endpoint (e.g. 'series/observations') and return the raw response body"""
+        breaker = self.breaker(path)
+        breaker.before_call(path)
+        try:
+            content = self._get_with_retries(path, params)
+        except requests.HTTPError as e:
+            # A 4xx answer (unknown series, bad key) means the endpoint itself is up
+            if e.response is None or e.response.status_code in RETRY_STATUSES:
+                breaker.record_failure()
+            else:
+                breaker.record_success()
+            raise
+        except Exception:
+            breaker.record_failure()
+            raise
+        breaker.record_success()
+        return content
+
+    def _get_with_retries(self, path, params):
+        url = FRED_API_ROOT + path
+        started = time.monotonic()
+
+        for attempt in range(self.max_retries + 1):
+            self.bucket.acquire()
+            response = None
+            try:
+                response = self.session.get(url, params=params, timeout=self.timeout)
+            except (requests.ConnectionError, requests.Timeout) as e:
+                # The original message embeds the request URL, API key included
+                error = type(e)(f"FRED {path} request failed: {type(e).__name__}")
+            else:
+                if response.ok:
+                    return response.content
+                error = _http_error(path, response)
+                if response.status_code not in RETRY_STATUSES:
+                    raise error
+
+            delay = self._backoff(attempt, response)
+            if attempt == self.max_retries or time.monotonic() - started + delay > self.deadline:
+                raise error
+            time.sleep(delay)
+
+    def get_json(self, path, params):
+        """GET a FRED endpoint and return the decoded JSON body"""
+        return json.loads(self.get_content(path, params))
+
+
+def _http_error(path, response):
+    # Built by hand rather than via raise_for_status so the API key in the URL never reaches the UI
+    try:
+        detail = response.json().get('error_message', response.reason)
+    except ValueError:
+        detail = response.reason
+    return requests.HTTPError(f"FRED {path} returned {response.status_code}: {detail}", response=response)
+
+
+_default_client = None
+_default_client_lock = threading.Lock()
+
+
+def get_client():
+    """Return the process-wide FRED client, creating it on first use"""
+    global _default_client
+    with _default_client_lock:
+        if _default_client is None:
+            _default_client = FredClient()
+        return _default_client
@@ -0,0 +1,82 @@
+"""Largest-Triangle-Three-Buckets downsampling of line traces before they are sent to the browser"""
+
+import os
+
+import numpy as np
+
+# Width in pixels of a full-width chart in the wide page layout; each subplot gets its
+# share of it from the domain of its x axis
+CHART_WIDTH = int(os.getenv('FRED_CHART_WIDTH', 1400))
+
+# Points kept per horizontal pixel; more than one per pixel is not visible on a line chart
+POINTS_PER_PIXEL = 1
+
+
+def lttb(x, y, n_out):
+    """Return the indices of the n_out points of (x, y) that best keep the shape of the line
+
+    ``x`` must be sorted and numeric. The first and last points are always
+    kept; every bucket in between contributes the point forming the largest
+    triangle with the point kept from the previous bucket and the average of
+    the next one. Returns all indices when there is nothing to drop.
+    """
+    n = len(x)
+    if n_out >= n or n_out < 3:
+        return np.arange(n)
+
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+    # Bucket edges over the interior points, first and last excluded
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.int64)
+
+    # Averages of every bucket up front, followed by the last point, which stands in for
+    # the bucket after the final one
+    sizes = np.diff(edges)
+    mean_x = np.append(np.add.reduceat(x[1:n - 1], edges[:-1] - 1) / sizes, x[-1])
+    mean_y = np.append(np.add.reduceat(y[1:n - 1], edges[:-1] - 1) / sizes, y[-1])
+
+    selected = np.empty(n_out, dtype=np.int64)
+    selected[0], selected[-1] = 0, n - 1
+    previous = 0
+    for i in range(n_out - 2):
+        lo, hi = edges[i], edges[i + 1]
+        # Twice the triangle areas; the constant factor does not change the argmax
+        area = np.abs((x[previous] - mean_x[i + 1]) * (y[lo:hi] - y[previous])
+                      - (x[previous] - x[lo:hi]) * (mean_y[i + 1] - y[previous]))
+        previous = selected[i + 1] = lo + int(area.argmax())
+    return selected
+
+
+def _numeric_x(x):
+    """Map trace x values onto floats: dates to their integer ticks, anything else to its position"""
+    if np.issubdtype(x.dtype, np.datetime64):
+        return x.astype('datetime64[ns]').astype(np.int64).astype(np.float64)
+    if np.issubdtype(x.dtype, np.number):
+        return x.astype(np.float64)
+    return np.arange(len(x), dtype=np.float64)
+
+
+def trace_width(fig, trace, chart_width=CHART_WIDTH):
+    """Return the width in pixels of the plotting area a trace is drawn into"""
+    axis = 'xaxis' + (trace.xaxis or 'x')[1:]
+    domain = fig.layout[axis].domain if axis in fig.layout else None
+    start, end = domain or (0, 1)
+    return max(int((end - start) * chart_width), 1)
+
+
+def downsample_figure(fig, chart_width=CHART_WIDTH):
+    """Reduce every line trace longer than its pixel width with LTTB, in place, and return the figure
+
+    Traces that are not scatter lines, are already short enough, or hold
+    missing values (whose gaps LTTB would close) are left untouched.
+    """
+    for trace in fig.data:
+        if trace.type != 'scatter' or trace.x is None or trace.y is None:
+            continue
+        n_out = trace_width(fig, trace, chart_width) * POINTS_PER_PIXEL
+        x, y = np.asarray(trace.x), np.asarray(trace.y)
+        if len(y) <= n_out or not np.issubdtype(y.dtype, np.number) or not np.isfinite(y).all():
+            continue
+        keep = lttb(_numeric_x(x), y, n_out)
+        trace.update(x=x[keep], y=y[keep])
+    return fig
@@ -0,0 +1,63 @@
+"""Headline metrics of the monetary eras compared by the dashboard"""
+
+import threading
+
+from fed_analysis.analytics import purchasing_power_lost
+from fed_analysis.cache import is_closed_window, load_many
+from fed_analysis.metrics import series_metrics
+
+FED_CREATION = '1913-12-23'
+NIXON_SHOCK = '1971-08-15'
+
+ERA_SERIES = ['CPIAUCSL', 'GDP']
+
+_pinned_metrics = {}
+_pinned_metrics_lock = threading.Lock()
+
+
+def compute_era_metrics(cpi_metrics=None, gdp_metrics=None):
+    """Average annual inflation, GDP growth and purchasing power lost from CPI and GDP series metrics
+
+    Takes the results of series_metrics for each series; metrics whose input
+    series is missing are reported as 0.
+    """
+    metrics = {'avg_inflation': 0, 'avg_gdp_growth': 0, 'purchasing_power_lost': 0}
+
+    if cpi_metrics is not None:
+        metrics['avg_inflation'] = cpi_metrics['avg_yoy']
+        metrics['purchasing_power_lost'] = purchasing_power_lost(cpi_metrics['first'], cpi_metrics['last'])
+
+    if gdp_metrics is not None and gdp_metrics['count'] > 1:
+        metrics['avg_gdp_growth'] = gdp_metrics['cagr']
+
+    return metrics
+
+
+def load_era_metrics(api_key, start_date, end_date=None):
+    """Load an era's CPI and GDP and compute its headline metrics
+
+    Returns the metrics (None when none of the era's series could be loaded)
+    and a dict of load errors keyed by series id. Metrics of a closed era are
+    computed once and pinned for the life of the process, so later calls
+    touch neither the network nor pandas.
+    """
+    key = (start_date, end_date)
+    with _pinned_metrics_lock:
+        if key in _pinned_metrics:
+            return _pinned_metrics[key], {}
+
+    # Load concurrently first; the metrics then read the warm cache
+    data, errors = load_many(ERA_SERIES, api_key, start_date, end_date)
+    loaded = {
+        series_id: series_metrics(series_id, api_key, start_date, end_date)
+        for series_id, df in data.items()
+        if not df.empty
+    }
+    if not loaded:
+        return None, errors
+
+    metrics = compute_era_metrics(loaded.get('CPIAUCSL'), loaded.get('GDP'))
+    if not errors and is_closed_window(end_date):
+        with _pinned_metrics_lock:
+            _pinned_metrics[key] = metrics
+    return metrics, errors
@@ -0,0 +1,102 @@
+"""Process-wide LRU cache of built Plotly figures, keyed by page, window and data version"""
+
+import os
+import threading
+from collections import OrderedDict
+
+import numpy as np
+
+from fed_analysis.cache import get_cache
+
+# Memory bound on cached figures, measured by the size of their trace data
+FIGURE_CACHE_BYTES = int(os.getenv('FRED_FIGURE_CACHE_MB', 64)) * 1024 * 1024
+
+# Allowance for the layout and the non-array properties of each trace
+TRACE_OVERHEAD_BYTES = 2048
+
+_DATA_PROPERTIES = ('x', 'y', 'z', 'text', 'customdata')
+
+
+def figure_size(fig):
+    """Approximate the memory held by a figure from the arrays of its traces"""
+    size = TRACE_OVERHEAD_BYTES
+    for trace in fig.data:
+        size += TRACE_OVERHEAD_BYTES
+        for name in _DATA_PROPERTIES:
+            value = trace[name] if name in trace else None
+            if value is not None and not isinstance(value, str):
+                size += np.asarray(value).nbytes
+    return size
+
+
+def data_version(series_ids, api_key):
+    """Return the versions of the cached histories a figure is drawn from
+
+    Series that cannot be loaded contribute None, so a figure drawn without
+    them is rebuilt once they load.
+    """
+    versions = []
+    for series_id in series_ids:
+        try:
+            versions.append(get_cache().entry(series_id, api_key).version)
+        except Exception:
+            versions.append(None)
+    return tuple(versions)
+
+
+class FigureCache:
+    """Built figures kept by key, least recently used evicted first beyond ``max_bytes``
+
+    Figures are shared by every session reading the same key, so they must
+    not be modified once stored; keys should include the version of every
+    series drawn (see data_version) so new data builds a new figure.
+    """
+
+    def __init__(self, max_bytes=FIGURE_CACHE_BYTES):
+        self.max_bytes = max_bytes
+        self.nbytes = 0
+        self._figures = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._figures)
+
+    def get(self, key):
+        """Return the figure stored under key, or None"""
+        with self._lock:
+            if key not in self._figures:
+                return None
+            self._figures.move_to_end(key)
+            return self._figures[key][0]
+
+    def put(self, key, fig):
+        """Store a figure under key and return it; figures larger than the whole bound are not kept"""
+        size = figure_size(fig)
+        if size > self.max_bytes:
+            return fig
+        with self._lock:
+            if key in self._figures:
+                self.nbytes -= self._figures.pop(key)[1]
+            self._figures[key] = (fig, size)
+            self.nbytes += size
+            while self.nbytes > self.max_bytes:
+                self.nbytes -= self._figures.popitem(last=False)[1][1]
+        return fig
+
+    def clear(self):
+        with self._lock:
+            self._figures.clear()
+            self.nbytes = 0
+
+
+_default_figure_cache = None
+_default_figure_cache_lock = threading.Lock()
+
+
+def get_figure_cache():
+    """Return the process-wide figure cache, creating it on first use"""
+    global _default_figure_cache
+    with _default_figure_cache_lock:
+        if _default_figure_cache is None:
+            _default_figure_cache = FigureCache()
+        return _default_figure_cache
@@ -0,0 +1,68 @@
+"""FRED API access backed by the on-disk series store"""
+
+from datetime import datetime, timedelta
+
+from fed_analysis.client import get_client
+from fed_analysis.parser import parse_observations
+from fed_analysis.store import get_store
+
+# FRED revisions (seasonal factors, benchmark updates) mostly stay within the last few
+# years, so a window ending further back than this is treated as closed history
+REVISION_HORIZON = timedelta(days=5 * 365)
+
+
+def fetch_observations(series_id, api_key, start_date=None, end_date=None):
+    """Fetch observations from the FRED API as datetime64[D] date and float64 value arrays"""
+    params = {
+        'series_id': series_id,
+        'api_key': api_key,
+        'file_type': 'json'
+    }
+
+    if start_date:
+        params['observation_start'] = start_date
+    if end_date:
+        params['observation_end'] = end_date
+
+    payload = get_client().get_content('series/observations', params)
+    return parse_observations(payload)
+
+
+def fetch_series_info(series_id, api_key):
+    """Fetch the fred/series record of a series (title, frequency, units, last_updated, ...)"""
+    params = {
+        'series_id': series_id,
+        'api_key': api_key,
+        'file_type': 'json'
+    }
+    data = get_client().get_json('series', params)
+    return data['seriess'][0]
+
+
+def refresh_series(series_id, api_key, store=None):
+    """Bring the stored history of a series up to date
+
+    The series' last_updated timestamp is checked first and observations are
+    only requested when it has moved since the last refresh. A series that is
+    not stored yet is downloaded in full; otherwise the observations from
+    REVISION_HORIZON before the last stored date on are requested again, so
+    revised values (an advance GDP estimate, new seasonal factors) overwrite
+    the stored ones along with the new observations.
+    """
+    store = store or get_store()
+    last_date = store.last_date(series_id)
+    stored_info = store.metadata(series_id)
+    info = fetch_series_info(series_id, api_key)
+
+    if last_date and stored_info and stored_info['last_updated'] == info.get('last_updated'):
+        store.touch(series_id)
+        return
+
+    start_date = None
+    if last_date:
+        start_date = (datetime.strptime(last_date, '%Y-%m-%d') - REVISION_HORIZON).strftime('%Y-%m-%d')
+
+    dates, values = fetch_observations(series_id, api_key, start_date=start_date)
+    store.append(series_id, dates, values)
+    store.save_metadata(series_id, info)
+
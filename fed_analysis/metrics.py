@@ -0,0 +1,116 @@
+"""Frequency-aware growth metrics, memoized per series version"""
+
+import threading
+from collections import OrderedDict
+
+import numpy as np
+
+from fed_analysis.cache import get_cache
+
+# How far the observation found for "a year (or month) earlier" may sit before the exact
+# calendar date; daily and weekly series skip weekends and holidays, the others must match
+LOOKBACK_TOLERANCE = {
+    'D': np.timedelta64(7, 'D'),
+    'W': np.timedelta64(7, 'D'),
+    'M': np.timedelta64(0, 'D'),
+    'Q': np.timedelta64(0, 'D'),
+    'A': np.timedelta64(0, 'D'),
+}
+
+DAYS_PER_YEAR = 365.25
+
+# Bound on memoized results; each holds a few arrays the size of one series window
+MAX_MEMOIZED = 256
+
+_memo = OrderedDict()
+_memo_lock = threading.Lock()
+
+
+def _shift_months(dates, months):
+    """Move datetime64[D] dates back by whole calendar months, keeping the day of month
+
+    Days past the end of the target month are clamped to its last day, as
+    pd.DateOffset(months=-months) does, so Mar 31 moves back one month to Feb 28.
+    """
+    month_start = dates.astype('datetime64[M]')
+    day_offset = dates - month_start.astype('datetime64[D]')
+    target = month_start - months
+    last_day = (target + 1).astype('datetime64[D]') - target.astype('datetime64[D]') - 1
+    return target.astype('datetime64[D]') + np.minimum(day_offset, last_day)
+
+
+def change_over(dates, values, months, frequency):
+    """Percent change of each observation against the one a number of calendar months earlier
+
+    Observations without a counterpart that far back (within the frequency's
+    tolerance) get NaN, so a quarterly series has no month-over-month change
+    instead of a change measured over the wrong span.
+    """
+    dates = np.asarray(dates, dtype='datetime64[D]')
+    targets = _shift_months(dates, months)
+    prior = np.searchsorted(dates, targets, 'right') - 1
+    found = prior >= 0
+    found[found] = targets[found] - dates[prior[found]] <= LOOKBACK_TOLERANCE[frequency]
+
+    change = np.full(len(values), np.nan)
+    change[found] = (values[found] / values[prior[found]] - 1) * 100
+    return change
+
+
+def compute_series_metrics(dates, values, frequency):
+    """Compute YoY, MoM, CAGR and cumulative change of one series window
+
+    ``dates`` and ``values`` are sorted datetime64[D] and float64 arrays and
+    ``frequency`` the series' native frequency code. Percentages are in
+    percent; CAGR is measured over the actual span of the window in years.
+    """
+    dates = np.asarray(dates, dtype='datetime64[D]')
+    yoy = change_over(dates, values, 12, frequency)
+    mom = change_over(dates, values, 1, frequency)
+
+    metrics = {
+        'frequency': frequency,
+        'count': len(values),
+        'dates': dates,
+        'yoy': yoy,
+        'mom': mom,
+        'avg_yoy': np.nanmean(yoy) if np.isfinite(yoy).any() else np.nan,
+        'first': values[0] if len(values) else np.nan,
+        'last': values[-1] if len(values) else np.nan,
+        'years': np.nan,
+        'cagr': np.nan,
+        'cumulative_change': np.nan,
+    }
+    if len(values):
+        # A single observation has not changed, rather than changed by an unknown amount
+        metrics['cumulative_change'] = (values[-1] / values[0] - 1) * 100
+    if len(values) > 1:
+        years = (dates[-1] - dates[0]).astype(np.int64) / DAYS_PER_YEAR
+        metrics['years'] = years
+        if years > 0:
+            metrics['cagr'] = ((values[-1] / values[0]) ** (1 / years) - 1) * 100
+    return metrics
+
+
+def series_metrics(series_id, api_key, start_date=None, end_date=None):
+    """Return the metrics of a series over a date window, computed once per data version
+
+    Results are memoized on (series, window, version of the cached history), so
+    reruns and other pages reading the same window share one computation and a
+    refreshed history is picked up as soon as it lands in the cache.
+    """
+    entry = get_cache().entry(series_id, api_key)
+    key = (series_id, start_date, end_date, entry.version)
+    with _memo_lock:
+        if key in _memo:
+            _memo.move_to_end(key)
+            return _memo[key]
+
+    lo, hi = entry.bounds(start_date, end_date)
+    metrics = compute_series_metrics(entry.dates[lo:hi], entry.values[lo:hi], entry.frequency)
+
+    with _memo_lock:
+        _memo[key] = metrics
+        while len(_memo) > MAX_MEMOIZED:
+            _memo.popitem(last=False)
+    return metrics
@@ -0,0 +1,207 @@
+"""Declarative page specs, and a planner loading every series a page reads in one batch"""
+
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from datetime import datetime
+
+from fed_analysis.cache import MAX_FETCH_WORKERS, get_cache
+from fed_analysis.downsample import CHART_WIDTH
+
+# Range every page may read without declaring it: the window picked in the sidebar
+SELECTED = 'selected'
+
+# Seconds a page load may wait for its next series before the charts still missing some of
+# theirs are previewed with those that have arrived; loads served from memory never wait
+# that long, so they draw every chart once
+PREVIEW_AFTER = 0.25
+
+
+class Line:
+    """One series drawn as a line in a panel"""
+
+    def __init__(self, series_id, name, color=None, width=None):
+        self.series_id = series_id
+        self.name = name
+        self.color = color
+        self.width = width
+
+
+class Panel:
+    """One titled cell of a subplot grid, filled row by row"""
+
+    def __init__(self, title, lines):
+        self.title = title
+        self.lines = lines
+
+
+class Chart:
+    """A chart drawn from some of a page's series over one of its ranges
+
+    ``build(chart, frames, start_date, end_date)`` draws the figure from the
+    frames of the chart's series, or returns None when they cannot be drawn;
+    ``title`` is for the builder to use.
+    Frames are reduced to about ``max_points`` observations per series (see
+    SeriesCache.get); a zoomable chart is instead given its zoomed window in
+    full.
+    """
+
+    def __init__(self, key, series, build, title=None, range_name=SELECTED, max_points=None,
+                 zoomable=False):
+        self.key = key
+        self.series = list(series)
+        self.build = build
+        self.title = title
+        self.range_name = range_name
+        self.max_points = max_points
+        self.zoomable = zoomable
+
+
+class SubplotChart(Chart):
+    """A grid of line panels, loaded as pyramid overviews sized to the panel width and zoomable"""
+
+    def __init__(self, key, build, panels, rows, cols, title, range_name=SELECTED, height=800,
+                 showlegend=None, vertical_spacing=None):
+        series = [line.series_id for panel in panels for line in panel.lines]
+        super().__init__(key, dict.fromkeys(series), build, title, range_name, CHART_WIDTH // cols,
+                         zoomable=True)
+        self.panels = panels
+        self.rows = rows
+        self.cols = cols
+        self.height = height
+        self.showlegend = showlegend
+        self.vertical_spacing = vertical_spacing
+
+    def positions(self):
+        """Yield (row, col, panel) for every panel, filling the grid row by row"""
+        for i, panel in enumerate(self.panels):
+            yield i // self.cols + 1, i % self.cols + 1, panel
+
+
+class PageSpec:
+    """What a page reads: series per named date range, and the charts it draws
+
+    ``ranges`` maps range names to fixed (start, end) dates, end None meaning
+    today; the SELECTED range is supplied by the caller. ``series`` maps range
+    names to the series the page reads outside its charts (metric cards,
+    tables, summaries).
+    """
+
+    def __init__(self, series=None, ranges=None, charts=()):
+        self.series = series or {}
+        self.ranges = ranges or {}
+        self.charts = list(charts)
+
+    def chart(self, key):
+        return next(chart for chart in self.charts if chart.key == key)
+
+    def series_loads(self):
+        """Names of the loads the page reads outside its charts"""
+        return [SELECTED] + [name for name in self.series if name != SELECTED]
+
+    def windows(self, selected):
+        """Resolve every range to inclusive 'YYYY-MM-DD' start and end dates"""
+        today = datetime.now().strftime('%Y-%m-%d')
+        windows = {SELECTED: selected}
+        for name, (start_date, end_date) in self.ranges.items():
+            windows[name] = (start_date, end_date or today)
+        return windows
+
+    def plan(self, selected, zooms=None):
+        """Return the loads the page needs, as {name: (start, end, max_points, series ids)}
+
+        There is one load per range read outside the charts and one per chart,
+        named after the range or the chart key. A zoomed chart (``zooms`` maps
+        chart keys to (start, end) dates or None) loads the zoomed part of its
+        range at full resolution. The SELECTED load is always present, reading
+        no series when the page declares none, so a chart can be replanned from
+        the plan alone.
+        """
+        zooms = zooms or {}
+        windows = self.windows(selected)
+        plan = {SELECTED: selected + (None, [])}
+        for name, series_ids in self.series.items():
+            plan[name] = windows[name] + (None, list(dict.fromkeys(series_ids)))
+        for chart in self.charts:
+            start_date, end_date = windows[chart.range_name]
+            zoom = zooms.get(chart.key)
+            if zoom is None:
+                plan[chart.key] = (start_date, end_date, chart.max_points, chart.series)
+            else:
+                plan[chart.key] = (max(start_date, zoom[0]), min(end_date, zoom[1]), None, chart.series)
+        return plan
+
+
+def plan_series(plan):
+    """Return the deduplicated union of the series a plan reads, in first-use order"""
+    return list(dict.fromkeys(series_id for *_, series_ids in plan.values() for series_id in series_ids))
+
+
+def _load_names(plan, names):
+    return list(plan) if names is None else [name for name in plan if name in names]
+
+
+def iter_plan(plan, api_key, max_workers=MAX_FETCH_WORKERS, names=None, tick=None):
+    """Load every series of a plan once in the background, yielding each as soon as it has loaded
+
+    Yields (series id, {load name: frame}, exception or None) in the order the
+    series finish, so a page can draw whatever a series feeds while the rest
+    are still loading. Each series is loaded by a single task reading all of
+    its windows, so it is fetched at most once however many ranges and charts
+    read it. When ``names`` is given only those loads are sliced; the series
+    of the others are fetched into the cache all the same, for slicing later
+    (e.g. only when a chart's figure has to be built). With ``tick``, also
+    yields (None, {}, None) whenever that many seconds pass without a series
+    arriving. Series not started when the caller stops iterating are
+    cancelled.
+    """
+    series_ids = plan_series(plan)
+    names = _load_names(plan, names)
+    if not series_ids:
+        return
+
+    def load_windows(series_id):
+        windows = {
+            name: get_cache().get(series_id, api_key, *plan[name][:3])
+            for name in names
+            if series_id in plan[name][3]
+        }
+        if not windows:
+            get_cache().entry(series_id, api_key)
+        return windows
+
+    pool = ThreadPoolExecutor(max_workers=min(max_workers, len(series_ids)))
+    try:
+        futures = {pool.submit(load_windows, series_id): series_id for series_id in series_ids}
+        pending = set(futures)
+        while pending:
+            done, pending = wait(pending, timeout=tick, return_when=FIRST_COMPLETED)
+            if not done:
+                yield None, {}, None
+            for future in done:
+                try:
+                    yield futures[future], future.result(), None
+                except Exception as e:
+                    yield futures[future], {}, e
+    finally:
+        pool.shutdown(wait=False, cancel_futures=True)
+
+
+def load_plan(plan, api_key, max_workers=MAX_FETCH_WORKERS, names=None):
+    """Load every series of a plan once, over a bounded thread pool, and slice each load from it
+
+    Returns {load name: {series id: frame}} and a dict of the exceptions
+    raised by any series that failed to load; see iter_plan.
+    """
+    names = _load_names(plan, names)
+    data, errors, loaded = {name: {} for name in names}, {}, {}
+    for series_id, windows, error in iter_plan(plan, api_key, max_workers, names):
+        if error is None:
+            loaded[series_id] = windows
+        else:
+            errors[series_id] = error
+
+    # Keep each load's frames in the order its series were declared
+    for name in names:
+        for series_id in dict.fromkeys(plan[name][3]):
+            if series_id in loaded:
+                data[name][series_id] = loaded[series_id][name]
+    return data, errors
@@ -0,0 +1,179 @@
+"""Multi-frequency series panel with cached views aligned on a common calendar"""
+
+import numpy as np
+import pandas as pd
+
+# Supported frequencies, finest first, with the pandas rule labelling each period by
+# its first day the way FRED dates monthly, quarterly and annual observations
+FREQUENCIES = ['D', 'W', 'M', 'Q', 'A']
+RESAMPLE_RULES = {'D': 'D', 'W': 'W', 'M': 'MS', 'Q': 'QS', 'A': 'YS'}
+
+# Upper bounds on the median spacing in days between observations of each frequency
+_SPACING_LIMITS = [(4, 'D'), (10, 'W'), (45, 'M'), (135, 'Q')]
+
+# Reductions converting a finer series to a coarser calendar without going through pandas
+_FAST_REDUCTIONS = ('mean', 'last')
+
+# 1970-01-01, the datetime64 epoch, fell on a Thursday: three days after a Monday
+_EPOCH_WEEKDAY = 3
+
+
+def infer_frequency(dates):
+    """Infer a native frequency code ('D', 'W', 'M', 'Q' or 'A') from sorted observation dates"""
+    if len(dates) < 2:
+        return 'A'
+    spacing = np.median(np.diff(np.asarray(dates, dtype='datetime64[D]')).astype(np.int64))
+    for limit, frequency in _SPACING_LIMITS:
+        if spacing <= limit:
+            return frequency
+    return 'A'
+
+
+def period_labels(dates, frequency):
+    """Label each date with its period, as datetime64[D], the way RESAMPLE_RULES label them
+
+    Monthly, quarterly and annual periods are labelled by their first day,
+    weeks by the Sunday closing them and days by themselves.
+    """
+    days = np.asarray(dates, dtype='datetime64[D]')
+    if frequency == 'D':
+        return days
+    if frequency == 'W':
+        weekday = (days.astype(np.int64) + _EPOCH_WEEKDAY) % 7
+        return days + (6 - weekday).astype('timedelta64[D]')
+    if frequency == 'A':
+        return days.astype('datetime64[Y]').astype('datetime64[D]')
+    months = days.astype('datetime64[M]')
+    if frequency == 'Q':
+        months = months - months.astype(np.int64) % 3
+    return months.astype('datetime64[D]')
+
+
+def period_calendar(first, last, frequency):
+    """Return every period label from first to last inclusive, as datetime64[D]"""
+    if frequency in ('D', 'W'):
+        return np.arange(first, last + 1, 7 if frequency == 'W' else 1, dtype='datetime64[D]')
+    unit, step = {'M': ('M', 1), 'Q': ('M', 3), 'A': ('Y', 1)}[frequency]
+    periods = np.arange(first.astype(f'datetime64[{unit}]'), last.astype(f'datetime64[{unit}]') + 1, step)
+    return periods.astype('datetime64[D]')
+
+
+def _reduce_periods(positions, values, size, how):
+    """Reduce values already in date order per calendar position, leaving empty periods NaN"""
+    reduced = np.full(size, np.nan)
+    if how == 'mean':
+        counts = np.bincount(positions, minlength=size)
+        sums = np.bincount(positions, weights=values, minlength=size)
+        present = counts > 0
+        reduced[present] = sums[present] / counts[present]
+    else:
+        # Later observations overwrite earlier ones, leaving each period's last value
+        reduced[positions] = values
+    return reduced
+
+
+class SeriesPanel:
+    """A set of series with different native frequencies, viewable on one calendar
+
+    Each series keeps its native observations. ``aligned(frequency)`` converts
+    every series to the target frequency explicitly: finer series are reduced
+    per period with their aggregation ('mean' by default, or 'last'), and
+    coarser series are left with gaps rather than being invented. Aligned views
+    are cached per target frequency.
+    """
+
+    def __init__(self, series, how=None):
+        self._series = {series_id: s.sort_index() for series_id, s in series.items()}
+        self._how = how or {}
+        self._frequencies = {
+            series_id: infer_frequency(s.index.to_numpy()) for series_id, s in self._series.items()
+        }
+        self._views = {}
+
+    @classmethod
+    def from_frames(cls, frames, how=None):
+        """Build a panel from frames holding a 'date' column and one value column each"""
+        series = {}
+        for series_id, df in frames.items():
+            value_column = series_id if series_id in df.columns else 'value'
+            series[series_id] = pd.Series(
+                df[value_column].to_numpy(), index=pd.DatetimeIndex(df['date']), name=series_id
+            )
+        return cls(series, how)
+
+    def __contains__(self, series_id):
+        return series_id in self._series
+
+    def __len__(self):
+        return len(self._series)
+
+    @property
+    def series_ids(self):
+        return list(self._series)
+
+    def frequency(self, series_id):
+        """Return the native frequency code of a series"""
+        return self._frequencies[series_id]
+
+    def common_frequency(self, series_ids=None):
+        """Return the finest frequency at which every given series has an observation per period"""
+        series_ids = series_ids or self.series_ids
+        if not series_ids:
+            return 'A'
+        return max((self._frequencies[series_id] for series_id in series_ids), key=FREQUENCIES.index)
+
+    def series(self, series_id, frequency=None):
+        """Return one series at its native frequency, or converted to the given frequency"""
+        if frequency is None or frequency == self._frequencies[series_id]:
+            return self._series[series_id]
+        return self.aligned(frequency)[series_id].dropna()
+
+    def aligned(self, frequency=None):
+        """Return all series as columns of one frame on the calendar of the given frequency
+
+        Defaults to the common frequency of the panel, where no period is left
+        empty by a coarser series. The frame is shared by every caller of the
+        same view, so derive new frames from it rather than assigning into it.
+        """
+        frequency = frequency or self.common_frequency()
+        if frequency not in self._views:
+            if all(self._how.get(series_id, 'mean') in _FAST_REDUCTIONS for series_id in self._series):
+                self._views[frequency] = self._reduce(frequency)
+            else:
+                rule = RESAMPLE_RULES[frequency]
+                columns = {
+                    series_id: s.resample(rule).agg(self._how.get(series_id, 'mean'))
+                    for series_id, s in self._series.items()
+                }
+                self._views[frequency] = pd.DataFrame(columns)
+        return self._views[frequency]
+
+    def _reduce(self, frequency):
+        """Build the aligned view with NumPy, matching what resampling every series would give
+
+        Each observation is mapped to its period label and placed on a calendar
+        made of the periods spanned by each series with a single searchsorted,
+        which is far cheaper than pandas resampling when windows change on
+        every rerun.
+        """
+        labels = {
+            series_id: period_labels(s.index.to_numpy(), frequency) for series_id, s in self._series.items()
+        }
+        spans = [period_calendar(dates[0], dates[-1], frequency) for dates in labels.values() if len(dates)]
+        calendar = np.unique(np.concatenate(spans)) if spans else np.array([], dtype='datetime64[D]')
+
+        columns = {}
+        for series_id, s in self._series.items():
+            values = s.to_numpy(dtype=np.float64)
+            valid = ~np.isnan(values)
+            positions = np.searchsorted(calendar, labels[series_id][valid])
+            columns[series_id] = _reduce_periods(
+                positions, values[valid], len(calendar), self._how.get(series_id, 'mean')
+            )
+        unit = next(iter(self._series.values())).index.unit if self._series else 'ns'
+        index = pd.DatetimeIndex(calendar.astype(f'datetime64[{unit}]'), name=self._index_name())
+        return pd.DataFrame(columns, index=index)
+
+    def _index_name(self):
+        names = {s.index.name for s in self._series.values()}
+        return names.pop() if len(names) == 1 else None
@@ -0,0 +1,77 @@
+"""Multi-resolution min/max/last summaries of a series, for light overviews of long histories"""
+
+import numpy as np
+
+# Observations per bucket grow by this factor from one level to the next
+PYRAMID_FACTOR = 2
+
+# Levels stop once a level has no more buckets than this
+MIN_BUCKETS = 16
+
+
+class SeriesPyramid:
+    """Min, max and last observation of a series over buckets of 2, 4, 8, ... observations
+
+    Each level records, per bucket, the positions in the full series of its
+    minimum, maximum and last observations, so an overview drawn from a level
+    is made of real observations and keeps every peak and trough of the line.
+    Levels are built bottom-up, each from the one below, in O(n) overall.
+    Values must hold no NaN (the series store drops missing observations).
+    """
+
+    def __init__(self, values, factor=PYRAMID_FACTOR, min_buckets=MIN_BUCKETS):
+        self.factor = factor
+        self.size = len(values)
+        self.levels = []
+
+        values = self.values = np.asarray(values, dtype=np.float64)
+        min_at = max_at = last_at = np.arange(self.size)
+        while len(last_at) > min_buckets:
+            min_at = self._reduce(min_at, values, np.argmin, np.inf)
+            max_at = self._reduce(max_at, values, np.argmax, -np.inf)
+            group_ends = np.arange(factor - 1, len(last_at) + factor - 1, factor)
+            last_at = last_at[np.minimum(group_ends, len(last_at) - 1)]
+            self.levels.append((min_at, max_at, last_at))
+
+    def _reduce(self, positions, values, pick, fill):
+        """Pick one position out of every group of ``factor`` positions of the level below"""
+        padding = -len(positions) % self.factor
+        candidates = np.append(values[positions], np.full(padding, fill)).reshape(-1, self.factor)
+        padded = np.append(positions, np.zeros(padding, dtype=positions.dtype)).reshape(-1, self.factor)
+        return padded[np.arange(len(padded)), pick(candidates, axis=1)]
+
+    def bucket_size(self, level):
+        """Number of observations summarized by each bucket of a level (0 is the first level)"""
+        return self.factor ** (level + 1)
+
+    def select(self, lo, hi, max_points):
+        """Return positions of at most about max_points observations summarizing [lo, hi)
+
+        All positions are returned when the range is short enough; otherwise
+        the finest level fitting the budget (three points per bucket) supplies
+        the minimum, maximum and last observation of every bucket overlapping
+        the range, plus the range's first and last observations. The two edge
+        buckets the range may cut through are scanned at full resolution, so
+        the minimum and maximum inside the range are always kept.
+        """
+        if hi - lo <= max_points or not self.levels:
+            return np.arange(lo, hi)
+
+        for level, (min_at, max_at, last_at) in enumerate(self.levels):
+            size = self.bucket_size(level)
+            first_bucket, end_bucket = lo // size, -(-hi // size)
+            if 3 * (end_bucket - first_bucket) <= max_points or level == len(self.levels) - 1:
+                break
+
+        # A bucket cut by the range can have its extremes outside it, so the
+        # edge buckets' extremes come from their part inside the range instead
+        inner = slice(first_bucket + 1, end_bucket - 1)
+        edges = [lo, hi - 1]
+        for start, stop in ((lo, min(hi, (first_bucket + 1) * size)), (max(lo, (end_bucket - 1) * size), hi)):
+            window = self.values[start:stop]
+            edges += [start + np.argmin(window), start + np.argmax(window)]
+
+        buckets = slice(first_bucket, end_bucket)
+        positions = np.concatenate((edges, min_at[inner], max_at[inner], last_at[buckets]))
+        positions = np.unique(positions)
+        return positions[(positions >= lo) & (positions < hi)]
@@ -0,0 +1,254 @@
+"""On-disk store holding the full observation history of each FRED series
+
+The store is shared by every process pointed at the same cache directory:
+several dashboard workers behind a load balancer read and write one SQLite
+database in WAL mode, and take a per-series file lock around each refresh so
+a series is fetched from FRED by one worker and read by all the others.
+
+Next to the database, the full history of each series is kept in a .npy
+file of (datetime64[D] date, float64 value) records, written anew whenever
+its observations change. Processes map these files read-only instead of
+querying the observations, so a restarted worker loads its series in
+milliseconds and every worker reads the same pages of the OS page cache.
+"""
+
+import os
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime
+
+import numpy as np
+
+try:
+    import fcntl
+except ImportError:  # Windows: refreshes are then coordinated within each process only
+    fcntl = None
+
+# Directory holding the local series store, shared by every dashboard process
+DEFAULT_CACHE_DIR = os.getenv('FRED_CACHE_DIR', '.fred_cache')
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS observations (
+    series_id TEXT NOT NULL,
+    date TEXT NOT NULL,
+    value REAL NOT NULL,
+    PRIMARY KEY (series_id, date)
+) WITHOUT ROWID;
+
+CREATE TABLE IF NOT EXISTS series (
+    series_id TEXT PRIMARY KEY,
+    last_date TEXT,
+    fetched_at TEXT NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS series_meta (
+    series_id TEXT PRIMARY KEY,
+    title TEXT,
+    frequency TEXT,
+    frequency_short TEXT,
+    units TEXT,
+    last_updated TEXT
+);
+"""
+
+# Fields of a FRED series record kept in series_meta
+METADATA_FIELDS = ('title', 'frequency', 'frequency_short', 'units', 'last_updated')
+
+# Record layout of the .npy history files; dates and values are field views of one mapping
+HISTORY_DTYPE = np.dtype([('date', 'datetime64[D]'), ('value', np.float64)])
+
+# Attempts at mapping the latest history file before reading the observations instead
+HISTORY_READ_ATTEMPTS = 3
+
+
+class SeriesStore:
+    """SQLite store of FRED observations, one row per (series, date), with .npy copies of each history"""
+
+    def __init__(self, cache_dir=DEFAULT_CACHE_DIR):
+        self.lock_dir = os.path.join(cache_dir, 'locks')
+        self.array_dir = os.path.join(cache_dir, 'series')
+        os.makedirs(self.lock_dir, exist_ok=True)
+        os.makedirs(self.array_dir, exist_ok=True)
+        self.path = os.path.join(cache_dir, 'fred_series.sqlite')
+        with self._connect() as conn:
+            # WAL lets every worker keep reading while another one writes a refreshed series;
+            # the mode is stored in the database file, so setting it again is a no-op
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.executescript(SCHEMA)
+
+    @contextmanager
+    def _connect(self):
+        # One short-lived connection per operation keeps the store safe to use from any thread
+        conn = sqlite3.connect(self.path, timeout=30)
+        conn.execute('PRAGMA synchronous=NORMAL')
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    @contextmanager
+    def refresh_lock(self, series_id):
+        """Hold the exclusive lock on refreshing a series, across every process sharing the store"""
+        # The lock is released when its file is closed, including when the holder dies
+        with open(os.path.join(self.lock_dir, f'{series_id}.lock'), 'a') as lock_file:
+            if fcntl is not None:
+                fcntl.flock(lock_file, fcntl.LOCK_EX)
+            yield
+
+    def last_date(self, series_id):
+        """Return the latest stored observation date as 'YYYY-MM-DD', or None if the series is not stored"""
+        with self._connect() as conn:
+            row = conn.execute(
+                'SELECT last_date FROM series WHERE series_id = ?', (series_id,)
+            ).fetchone()
+        return row[0] if row else None
+
+    def fetched_at(self, series_id):
+        """Return when the series was last refreshed from FRED as a Unix timestamp, or None if not stored"""
+        with self._connect() as conn:
+            row = conn.execute(
+                'SELECT fetched_at FROM series WHERE series_id = ?', (series_id,)
+            ).fetchone()
+        return datetime.fromisoformat(row[0]).timestamp() if row else None
+
+    def metadata(self, series_id):
+        """Return the stored FRED metadata of a series as a dict, or None if none is stored"""
+        with self._connect() as conn:
+            row = conn.execute(
+                f"SELECT {', '.join(METADATA_FIELDS)} FROM series_meta WHERE series_id = ?", (series_id,)
+            ).fetchone()
+        return dict(zip(METADATA_FIELDS, row)) if row else None
+
+    def save_metadata(self, series_id, info):
+        """Record the FRED metadata of a series, taken from a fred/series record"""
+        with self._connect() as conn:
+            conn.execute(
+                f"INSERT OR REPLACE INTO series_meta (series_id, {', '.join(METADATA_FIELDS)}) "
+                f"VALUES (?, {', '.join('?' * len(METADATA_FIELDS))})",
+                [series_id] + [info.get(field) for field in METADATA_FIELDS]
+            )
+
+    def touch(self, series_id):
+        """Mark a stored series as checked against FRED now without changing its observations"""
+        with self._connect() as conn:
+            conn.execute(
+                'UPDATE series SET fetched_at = ? WHERE series_id = ?',
+                (datetime.now().isoformat(timespec='seconds'), series_id)
+            )
+
+    def append(self, series_id, dates, values):
+        """Insert (or overwrite) observations given as date and value arrays, skipping missing values"""
+        present = ~np.isnan(values)
+        rows = zip(
+            [series_id] * int(present.sum()),
+            np.datetime_as_string(dates[present], unit='D').tolist(),
+            values[present].tolist()
+        )
+        with self._connect() as conn:
+            conn.executemany(
+                'INSERT OR REPLACE INTO observations (series_id, date, value) VALUES (?, ?, ?)',
+                rows
+            )
+            conn.execute(
+                'INSERT OR REPLACE INTO series (series_id, last_date, fetched_at) '
+                'VALUES (?, (SELECT MAX(date) FROM observations WHERE series_id = ?), ?)',
+                (series_id, series_id, datetime.now().isoformat(timespec='seconds'))
+            )
+        self._write_history(series_id, *self.read(series_id))
+
+    def read(self, series_id, start_date=None, end_date=None):
+        """Return stored observations in date order as datetime64[D] date and float64 value arrays"""
+        query = 'SELECT date, value FROM observations WHERE series_id = ?'
+        params = [series_id]
+        if start_date:
+            query += ' AND date >= ?'
+            params.append(start_date)
+        if end_date:
+            query += ' AND date <= ?'
+            params.append(end_date)
+        query += ' ORDER BY date'
+
+        with self._connect() as conn:
+            rows = conn.execute(query, params).fetchall()
+        dates = np.array([row[0] for row in rows], dtype='datetime64[D]')
+        values = np.array([row[1] for row in rows], dtype=np.float64)
+        return dates, values
+
+    def _history_dir(self, series_id):
+        return os.path.join(self.array_dir, series_id)
+
+    def _latest_history(self, series_id):
+        """Return the path of the newest history file of a series, or None if it has none"""
+        try:
+            names = [name for name in os.listdir(self._history_dir(series_id)) if name.endswith('.npy')]
+        except FileNotFoundError:
+            return None
+        return os.path.join(self._history_dir(series_id), max(names)) if names else None
+
+    def _write_history(self, series_id, dates, values):
+        # Every version goes to a file of its own, named to sort by write time, and appears
+        # complete through a rename onto a fresh name: a reader maps either version in full,
+        # and no file is replaced while mapped (which Windows refuses)
+        directory = self._history_dir(series_id)
+        os.makedirs(directory, exist_ok=True)
+        history = np.empty(len(dates), dtype=HISTORY_DTYPE)
+        history['date'] = dates
+        history['value'] = values
+
+        name = f'{time.time_ns():020d}-{os.getpid()}-{threading.get_ident()}'
+        temp_path = os.path.join(directory, f'{name}.tmp')
+        try:
+            with open(temp_path, 'wb') as f:
+                np.save(f, history)
+            os.replace(temp_path, os.path.join(directory, f'{name}.npy'))
+        except BaseException:
+            # A full disk or an interrupted write leaves nothing behind but the last version
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
+
+        # Older versions go once nobody can pick them anymore; where a process still maps
+        # one and the platform refuses, it is left for a later write to remove
+        for old_name in os.listdir(directory):
+            if old_name.endswith('.npy') and old_name < f'{name}.npy':
+                try:
+                    os.remove(os.path.join(directory, old_name))
+                except OSError:
+                    pass
+
+    def history(self, series_id):
+        """Return the full stored history as read-only datetime64[D] date and float64 value arrays
+
+        The arrays are views of the series' newest .npy file, memory-mapped;
+        the file is written from the observations on first use if missing (a
+        store created before history files existed).
+        """
+        for _ in range(HISTORY_READ_ATTEMPTS):
+            path = self._latest_history(series_id)
+            if path is None:
+                self._write_history(series_id, *self.read(series_id))
+                continue
+            try:
+                history = np.load(path, mmap_mode='r')
+            except FileNotFoundError:
+                # Superseded and removed by a newer write since it was listed
+                continue
+            return history['date'], history['value']
+        # Writers keep replacing the history under this reader; the rows are always there
+        return self.read(series_id)
+
+
+_default_store = None
+_default_store_lock = threading.Lock()
+
+
+def get_store():
+    """Return the process-wide series store, creating it on first use"""
+    global _default_store
+    with _default_store_lock:
+        if _default_store is None:
+            _default_store = SeriesStore()
+        return _default_store
@@ -0,0 +1,64 @@
+"""Text themes of the dashboard: the headings and prose of each narrative variant
+
+The apps share every chart, series and computation; a theme only supplies the
+words around them. Themes are plain dicts keyed by the same names, so a new
+narrative is added here without touching the pages. Texts a theme leaves out
+are None and the page skips them.
+"""
+
+import os
+
+THEMES = {
+    # Fed_app.py's narrative
+    'ron_paul': {
+        'dedication': "This dashboard presents a detailed analysis of inflation, government spending, and monetary manipulation.",
+        'complete_header': "🎯 The Complete Analysis: Exposing the Fed's Impact",
+        'complete_chart': "Ron Paul's Warnings Visualized: The Fed's Economic Manipulation",
+        'correlations_subheader': "🔗 The Dangerous Correlations Ron Paul Warned About",
+        'key_insights': """### 🎯 Key Insights from the Data:
+
+1. **Money Supply & Inflation**: Strong positive correlation validates Ron Paul's warnings about monetary debasement
+2. **Government Spending & Debt**: Exponential growth pattern exactly as predicted
+3. **Fed Rate Manipulation**: Artificial interest rates distort market signals
+4. **Wealth Transfer**: Inflation disproportionately hurts savers and fixed-income Americans""",
+        'fiscal_header': "💸 Fiscal Policy Deep Dive: The Spending Addiction",
+        'fiscal_quote': """*"The government's insatiable appetite for spending, enabled by the Federal Reserve's money printing,
+has created an unsustainable debt spiral that threatens the economic future of America."*""",
+        'monetary_header': "🖨️ Monetary Policy Exposure: The Money Printing Machine",
+        'monetary_chart': "The Fed's Money Printing and Its Inflationary Consequences",
+        'money_supply_panel': 'Money Supply Explosion',
+        'inflation_panel': 'The Inflation Consequence',
+        'monetary_spinner': "Exposing the Fed's monetary manipulation...",
+        'dollar_lost': "Dollar Purchasing Power Lost Since",
+        'dollar_note': " This demonstrates the hidden tax of inflation that Ron Paul spent his career exposing.",
+        'fiat_era_chart': "The Fiat Currency Disaster: Ron Paul's Predictions Realized",
+    },
+    # Fed_app_1.py's narrative
+    'neutral': {
+        'dedication': "This dashboard presents a detailed analysis of inflation, government spending, and interest rates.",
+        'complete_header': "🎯 The Complete Analysis of the Federal Reserve.",
+        'complete_chart': "The Fed's Economic Analysis.",
+        'correlations_subheader': "🔗 The Correlation of the metrics part of the Federal Reserve Repository.",
+        'key_insights': None,
+        'fiscal_header': "💸 Fiscal Policy Deep Dive",
+        'fiscal_quote': None,
+        'monetary_header': "🖨️ Monetary Policy Analysis",
+        'monetary_chart': "The Money Printing and Inflationary Consequences",
+        'money_supply_panel': 'Money Supply',
+        'inflation_panel': 'Inflation',
+        'monetary_spinner': "The Fed Monetary Analysis...",
+        'dollar_lost': "Dollar Purchasing Power Since",
+        'dollar_note': "",
+        'fiat_era_chart': "The Consumer Impact of Fiat Currency.",
+    },
+}
+
+# Theme served when the URL names none (?theme=neutral); an app may pass its own default
+DEFAULT_THEME = os.getenv('FED_THEME', 'ron_paul')
+
+
+def resolve_theme(name=None, default=None):
+    """Return the name of the theme to serve: name if it is a known theme, else the default"""
+    if name in THEMES:
+        return name
+    return default if default in THEMES else DEFAULT_THEME
@@ -0,0 +1,98 @@
+"""Shared fixtures: a temporary series store and a fake FRED client recording every request"""
+
+import json
+import os
+import sys
+import threading
+import time
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from fed_analysis.store import SeriesStore  # noqa: E402
+
+
+def monthly_dates(start, periods):
+    """First-of-month datetime64[D] dates, the way FRED dates monthly observations"""
+    return (np.datetime64(start, 'M') + np.arange(periods)).astype('datetime64[D]')
+
+
+def observations_payload(dates, values):
+    """Encode observations as the raw bytes of a series/observations response ('.' for NaN)"""
+    observations = [
+        {
+            'realtime_start': '2026-10-16',
+            'realtime_end': '2026-10-16',
+            'date': str(date),
+            'value': '.' if np.isnan(value) else f"{value:.4f}"
+        }
+        for date, value in zip(dates, values)
+    ]
+    return json.dumps({'observations': observations}).encode()
+
+
+class FakeFred:
+    """Stands in for the FredClient returned by get_client, serving series set up by the test
+
+    Every request is recorded in ``requests`` as (path, params). ``delay``
+    slows each request down, so concurrent callers overlap, and ``error``,
+    when set, is raised instead of answering.
+    """
+
+    def __init__(self):
+        self.series = {}
+        self.requests = []
+        self.delay = 0
+        self.error = None
+        self._lock = threading.Lock()
+
+    def add(self, series_id, dates, values, last_updated='2026-10-01 07:45:02-05', frequency_short='M'):
+        self.series[series_id] = {
+            'dates': np.asarray(dates, dtype='datetime64[D]'),
+            'values': np.asarray(values, dtype=np.float64),
+            'info': {'id': series_id, 'last_updated': last_updated, 'frequency_short': frequency_short},
+        }
+
+    def observation_requests(self, series_id=None):
+        return [
+            params for path, params in self.requests
+            if path == 'series/observations' and series_id in (None, params['series_id'])
+        ]
+
+    def _request(self, path, params):
+        with self._lock:
+            self.requests.append((path, dict(params)))
+        if self.delay:
+            time.sleep(self.delay)
+        if self.error is not None:
+            raise self.error
+
+    def get_json(self, path, params):
+        return json.loads(self.get_content(path, params))
+
+    def get_content(self, path, params):
+        self._request(path, params)
+        series = self.series[params['series_id']]
+        if path == 'series':
+            return json.dumps({'seriess': [series['info']]}).encode()
+        keep = np.ones(len(series['dates']), dtype=bool)
+        if 'observation_start' in params:
+            keep &= series['dates'] >= np.datetime64(params['observation_start'])
+        if 'observation_end' in params:
+            keep &= series['dates'] <= np.datetime64(params['observation_end'])
+        return observations_payload(series['dates'][keep], series['values'][keep])
+
+
+@pytest.fixture
+def fake_fred(monkeypatch):
+    """Route every FRED request of fed_analysis.fred to a FakeFred"""
+    fred = FakeFred()
+    monkeypatch.setattr('fed_analysis.fred.get_client', lambda: fred)
+    return fred
+
+
+@pytest.fixture
+def store(tmp_path):
+    return SeriesStore(str(tmp_path / 'cache'))
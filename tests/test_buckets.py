@@ -0,0 +1,43 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from conftest import monthly_dates
+from fed_analysis.buckets import DECADES, NBER_RECESSIONS, BucketSet
+
+
+def test_dates_in_gaps_belong_to_no_bucket():
+    dates = np.array(['2008-06-01', '2012-01-01', '2020-03-15'], dtype='datetime64[D]')
+    index = NBER_RECESSIONS.assign(dates)
+
+    assert NBER_RECESSIONS.labels[index[0]] == '2007-12 to 2009-06'
+    assert index[1] == -1
+    assert NBER_RECESSIONS.labels[index[2]] == '2020-02 to 2020-04'
+
+
+def test_decade_means_match_a_pandas_groupby():
+    dates = monthly_dates('1947-01', 900)
+    values = np.random.default_rng(2).normal(3, 2, 900)
+    values[::13] = np.nan
+    result = DECADES.aggregate(dates, values, 'mean')
+
+    years = dates.astype('datetime64[Y]').astype(np.int64) + 1970
+    expected = pd.Series(values).groupby(years // 10 * 10).mean()
+    assert list(result['label']) == [f"{decade}s" for decade in expected.index]
+    assert np.allclose(result['value'], expected.to_numpy())
+    assert result['count'].sum() == np.count_nonzero(~np.isnan(values))
+
+
+def test_first_last_and_change():
+    buckets = BucketSet.contiguous('Half', ['H1', 'H2'], ['2020-01-01', '2020-07-01'], '2020-12-31')
+    dates = monthly_dates('2020-01', 12)
+    values = np.arange(1, 13, dtype=np.float64)
+
+    assert list(buckets.aggregate(dates, values, 'first')['value']) == [1, 7]
+    assert list(buckets.aggregate(dates, values, 'last')['value']) == [6, 12]
+    assert np.allclose(buckets.aggregate(dates, values, 'change')['value'], [500, 12 / 7 * 100 - 100])
+
+
+def test_unknown_reduction_is_rejected():
+    with pytest.raises(ValueError, match='Unknown reduction'):
+        DECADES.aggregate(monthly_dates('2020-01', 3), np.ones(3), 'median')
@@ -0,0 +1,156 @@
+import threading
+import time
+
+import numpy as np
+import pytest
+import requests
+
+from conftest import monthly_dates
+from fed_analysis.cache import SeriesCache
+
+
+def age_store(store, seconds):
+    """Make every stored series look last fetched from FRED ``seconds`` ago"""
+    with store._connect() as conn:
+        conn.execute("UPDATE series SET fetched_at = datetime(?, 'unixepoch', 'localtime')",
+                     (int(time.time() - seconds),))
+
+
+@pytest.fixture
+def cpi(fake_fred):
+    dates = monthly_dates('1950-01', 120)
+    fake_fred.add('CPIAUCSL', dates, np.linspace(20, 40, 120))
+    return dates
+
+
+def test_window_slices_the_cached_history(fake_fred, store, cpi):
+    cache = SeriesCache(store)
+    window = cache.get('CPIAUCSL', 'key', '1955-01-01', '1955-12-31')
+
+    assert len(window) == 12
+    assert str(window['date'].iloc[0])[:10] == '1955-01-01'
+    assert cache.get('CPIAUCSL', 'key').shape == (120, 2)
+    assert len(fake_fred.observation_requests()) == 1
+
+
+def test_windows_are_read_only_views_of_the_history(fake_fred, store, cpi):
+    cache = SeriesCache(store)
+    entry = cache.entry('CPIAUCSL', 'key')
+    # A window reaching the present; closed history is pinned as a copy of its own
+    window = cache.get('CPIAUCSL', 'key', '1955-01-01')
+
+    assert np.shares_memory(window['value'].to_numpy(), entry.values)
+    window.loc[0, 'value'] = -1.0
+    assert entry.values[60] != -1.0
+
+
+def test_concurrent_cold_loads_make_a_single_fetch(fake_fred, store, cpi):
+    cache = SeriesCache(store)
+    fake_fred.delay = 0.05
+    results = []
+
+    def load():
+        results.append(len(cache.get('CPIAUCSL', 'key')))
+
+    threads = [threading.Thread(target=load) for _ in range(40)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert results == [120] * 40
+    assert len(fake_fred.observation_requests()) == 1
+
+
+def test_expired_series_is_served_stale_while_refreshing(fake_fred, store, cpi):
+    SeriesCache(store).entry('CPIAUCSL', 'key')
+    age_store(store, 2 * 3600)
+    fake_fred.delay = 0.2
+
+    cache = SeriesCache(store)
+    started = time.monotonic()
+    stale = cache.entry('CPIAUCSL', 'key')
+    assert time.monotonic() - started < 0.2
+    assert stale.age() > cache.ttl
+
+    cache._refresher.shutdown(wait=True)
+    assert cache.entry('CPIAUCSL', 'key').age() < cache.ttl
+
+
+def test_series_past_max_staleness_waits_for_the_refresh(fake_fred, store, cpi):
+    SeriesCache(store).entry('CPIAUCSL', 'key')
+    age_store(store, 3 * 24 * 3600)
+
+    cache = SeriesCache(store)
+    assert cache.entry('CPIAUCSL', 'key').age() < cache.ttl
+    # last_updated has not moved, so only the series record was asked for
+    assert len(fake_fred.observation_requests()) == 1
+
+
+def test_failed_load_is_remembered(fake_fred, store, cpi):
+    cache = SeriesCache(store)
+    fake_fred.error = requests.ConnectionError('FRED is down')
+
+    with pytest.raises(requests.ConnectionError):
+        cache.entry('CPIAUCSL', 'key')
+    with pytest.raises(requests.ConnectionError):
+        cache.entry('CPIAUCSL', 'key')
+    assert len(fake_fred.requests) == 1
+
+    # Clearing the cache forgets the failure too
+    cache.clear()
+    fake_fred.error = None
+    assert len(cache.entry('CPIAUCSL', 'key').values) == 120
+
+
+def test_failed_refresh_serves_the_last_good_copy(fake_fred, store, cpi):
+    SeriesCache(store).entry('CPIAUCSL', 'key')
+    age_store(store, 3 * 24 * 3600)
+    fake_fred.error = requests.ConnectionError('FRED is down')
+    requests_before = len(fake_fred.requests)
+
+    cache = SeriesCache(store)
+    assert len(cache.entry('CPIAUCSL', 'key').values) == 120
+    assert len(cache.entry('CPIAUCSL', 'key').values) == 120
+    assert len(fake_fred.requests) == requests_before + 1
+
+
+def test_workers_sharing_a_store_reuse_each_others_refresh(fake_fred, store, cpi):
+    first, second = SeriesCache(store), SeriesCache(store)
+    first.entry('CPIAUCSL', 'key')
+    requests_before = len(fake_fred.requests)
+
+    # The second worker's copy has expired, but the store was refreshed within its TTL
+    second._entries['CPIAUCSL'] = first.entry('CPIAUCSL', 'key').subset()
+    second._entries['CPIAUCSL'].loaded_at -= 2 * second.ttl
+    second._run_refresh('CPIAUCSL', 'key', second._begin_refresh('CPIAUCSL')[0])
+
+    assert len(fake_fred.requests) == requests_before
+    assert second.entry('CPIAUCSL', 'key').age() < second.ttl
+
+
+def test_closed_windows_are_pinned_without_expiry(fake_fred, store, cpi):
+    cache = SeriesCache(store, max_pinned=1)
+    window = cache.get('CPIAUCSL', 'key', '1950-01-01', '1954-12-31')
+    assert list(cache._pinned) == [('CPIAUCSL', '1950-01-01', '1954-12-31')]
+
+    # Served as pinned even once the history is too stale to serve and FRED is down
+    cache.entry('CPIAUCSL', 'key').loaded_at -= 10 * cache.max_staleness
+    fake_fred.error = requests.ConnectionError('FRED is down')
+    requests_before = len(fake_fred.requests)
+    assert cache.get('CPIAUCSL', 'key', '1950-01-01', '1954-12-31').equals(window)
+    assert len(fake_fred.requests) == requests_before
+
+    fake_fred.error = None
+    cache.get('CPIAUCSL', 'key', '1951-01-01', '1954-12-31')
+    assert list(cache._pinned) == [('CPIAUCSL', '1951-01-01', '1954-12-31')]
+
+
+def test_long_windows_come_back_as_pyramid_overviews(fake_fred, store):
+    fake_fred.add('DGS10', np.arange('1962-01-02', '2010-01-01', dtype='datetime64[D]'),
+                  np.sin(np.arange(17531) / 100), frequency_short='D')
+    window = SeriesCache(store).get('DGS10', 'key', max_points=300)
+
+    assert len(window) <= 400
+    assert window['value'].max() == pytest.approx(1.0, abs=1e-3)
+    assert window['value'].min() == pytest.approx(-1.0, abs=1e-3)
@@ -0,0 +1,92 @@
+import json
+
+import pytest
+import requests
+
+from fed_analysis import client as client_module
+from fed_analysis.client import CircuitBreaker, CircuitOpenError, FredClient
+
+
+class Response:
+    def __init__(self, status_code, payload=None):
+        self.status_code = status_code
+        self.ok = status_code < 400
+        self.reason = 'Reason'
+        self.headers = {}
+        self.content = json.dumps(payload or {}).encode()
+
+    def json(self):
+        return json.loads(self.content)
+
+
+@pytest.fixture
+def fred_client(monkeypatch):
+    """A FredClient whose session answers from a script of responses, without sleeping"""
+    monkeypatch.setattr(client_module.time, 'sleep', lambda seconds: None)
+    fred_client = FredClient(rate_limit=6000, burst=1000)
+    fred_client.script = []
+    fred_client.urls = []
+
+    def get(url, params=None, timeout=None):
+        fred_client.urls.append(url)
+        answer = fred_client.script.pop(0)
+        if isinstance(answer, Exception):
+            raise answer
+        return answer
+
+    monkeypatch.setattr(fred_client.session, 'get', get)
+    return fred_client
+
+
+def test_retries_server_errors_then_returns_the_body(fred_client):
+    fred_client.script = [Response(503), requests.ConnectionError('reset'), Response(200, {'ok': 1})]
+    assert fred_client.get_json('series', {}) == {'ok': 1}
+    assert len(fred_client.urls) == 3
+
+
+def test_client_errors_are_not_retried(fred_client):
+    fred_client.script = [Response(400, {'error_message': 'Bad Request. The series does not exist.'})]
+    with pytest.raises(requests.HTTPError, match='series does not exist'):
+        fred_client.get_json('series/observations', {'api_key': 'SECRET'})
+    assert len(fred_client.urls) == 1
+
+
+def test_errors_do_not_leak_the_api_key(fred_client):
+    fred_client.script = [requests.ConnectionError('url?api_key=SECRET')] * (fred_client.max_retries + 1)
+    with pytest.raises(requests.ConnectionError) as error:
+        fred_client.get_json('series', {'api_key': 'SECRET'})
+    assert 'SECRET' not in str(error.value)
+
+
+def test_repeated_failures_open_the_circuit(fred_client):
+    fred_client.max_retries = 0
+    threshold = client_module.BREAKER_FAILURE_THRESHOLD
+    fred_client.script = [Response(503)] * threshold
+    for _ in range(threshold):
+        with pytest.raises(requests.HTTPError):
+            fred_client.get_content('series', {})
+
+    with pytest.raises(CircuitOpenError):
+        fred_client.get_content('series', {})
+    assert len(fred_client.urls) == threshold
+    # Each endpoint has a circuit of its own
+    fred_client.script = [Response(200)]
+    fred_client.get_content('series/observations', {})
+
+
+def test_open_circuit_lets_one_trial_call_through_after_the_reset_timeout(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(client_module.time, 'monotonic', lambda: now[0])
+    breaker = CircuitBreaker(failure_threshold=2, reset_timeout=60)
+    breaker.record_failure()
+    breaker.record_failure()
+    with pytest.raises(CircuitOpenError):
+        breaker.before_call('series')
+
+    now[0] += 61
+    breaker.before_call('series')
+    with pytest.raises(CircuitOpenError):
+        breaker.before_call('series')
+
+    breaker.record_success()
+    breaker.before_call('series')
@@ -0,0 +1,40 @@
+import numpy as np
+import plotly.graph_objects as go
+
+from fed_analysis.downsample import downsample_figure, lttb
+
+
+def test_keeps_endpoints_and_returns_sorted_indices():
+    x = np.arange(10_000, dtype=np.float64)
+    y = np.sin(x / 50)
+    selected = lttb(x, y, 500)
+
+    assert len(selected) == 500
+    assert selected[0] == 0 and selected[-1] == len(x) - 1
+    assert np.all(np.diff(selected) > 0)
+
+
+def test_keeps_isolated_spikes():
+    x = np.arange(5_000, dtype=np.float64)
+    y = np.zeros(5_000)
+    y[1234], y[4321] = 100, -100
+    selected = lttb(x, y, 100)
+
+    assert 1234 in selected and 4321 in selected
+
+
+def test_short_lines_are_left_whole():
+    assert np.array_equal(lttb(np.arange(50), np.arange(50), 100), np.arange(50))
+    assert np.array_equal(lttb(np.arange(50), np.arange(50), 2), np.arange(50))
+
+
+def test_figure_line_traces_are_cut_to_the_chart_width():
+    dates = np.arange('1962-01-02', '2010-01-01', dtype='datetime64[D]')
+    fig = go.Figure([
+        go.Scatter(x=dates, y=np.sin(np.arange(len(dates)) / 100), mode='lines'),
+        go.Bar(x=dates[:3000], y=np.ones(3000)),
+    ])
+    downsample_figure(fig, chart_width=800)
+
+    assert len(fig.data[0].x) == len(fig.data[0].y) <= 800
+    assert len(fig.data[1].x) == 3000
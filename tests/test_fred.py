@@ -0,0 +1,58 @@
+import numpy as np
+
+from conftest import monthly_dates
+from fed_analysis.fred import refresh_series
+
+
+def quarterly_dates(start, periods):
+    return (np.datetime64(start, 'M') + np.arange(0, 3 * periods, 3)).astype('datetime64[D]')
+
+
+def test_first_refresh_downloads_the_full_history(fake_fred, store):
+    fake_fred.add('GDP', quarterly_dates('1947-01', 300), np.arange(300, dtype=np.float64))
+    refresh_series('GDP', 'key', store)
+
+    assert 'observation_start' not in fake_fred.observation_requests()[0]
+    assert len(store.read('GDP')[0]) == 300
+    assert store.metadata('GDP')['last_updated'] == '2026-10-01 07:45:02-05'
+
+
+def test_unchanged_series_is_not_downloaded_again(fake_fred, store):
+    fake_fred.add('GDP', quarterly_dates('1947-01', 300), np.arange(300, dtype=np.float64))
+    refresh_series('GDP', 'key', store)
+    refresh_series('GDP', 'key', store)
+
+    assert len(fake_fred.observation_requests()) == 1
+    assert [path for path, params in fake_fred.requests] == ['series', 'series/observations', 'series']
+
+
+def test_revised_and_new_observations_reach_the_store(fake_fred, store):
+    dates = quarterly_dates('1947-01', 300)
+    fake_fred.add('GDP', dates, np.arange(300, dtype=np.float64))
+    refresh_series('GDP', 'key', store)
+
+    # The advance estimate of the last quarter is revised and a new quarter is published
+    values = np.append(np.arange(300, dtype=np.float64), 1000.0)
+    values[299] = 299.5
+    values[290] = 290.5
+    fake_fred.add('GDP', quarterly_dates('1947-01', 301), values, last_updated='2026-10-30 07:45:01-05')
+    refresh_series('GDP', 'key', store)
+
+    start = fake_fred.observation_requests()[-1]['observation_start']
+    assert '2016-01-01' <= start <= '2017-01-01'
+    stored_dates, stored_values = store.read('GDP')
+    assert np.array_equal(stored_values, values)
+    assert np.array_equal(store.history('GDP')[1], values)
+    assert store.metadata('GDP')['last_updated'] == '2026-10-30 07:45:01-05'
+
+
+def test_revisions_beyond_the_horizon_are_left_alone(fake_fred, store):
+    fake_fred.add('CPIAUCSL', monthly_dates('1947-01', 900), np.arange(900, dtype=np.float64))
+    refresh_series('CPIAUCSL', 'key', store)
+
+    revised = np.arange(900, dtype=np.float64)
+    revised[0] = -1
+    fake_fred.add('CPIAUCSL', monthly_dates('1947-01', 900), revised, last_updated='2026-11-01 07:45:01-05')
+    refresh_series('CPIAUCSL', 'key', store)
+
+    assert store.read('CPIAUCSL')[1][0] == 0
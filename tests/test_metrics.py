@@ -0,0 +1,61 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from conftest import monthly_dates
+from fed_analysis.metrics import _shift_months, change_over, compute_series_metrics
+
+
+def test_year_over_year_of_a_monthly_series():
+    dates = monthly_dates('2000-01', 36)
+    values = 100 * 1.01 ** np.arange(36)
+    yoy = change_over(dates, values, 12, 'M')
+
+    assert np.isnan(yoy[:12]).all()
+    assert np.allclose(yoy[12:], (1.01 ** 12 - 1) * 100)
+
+
+def test_quarterly_series_has_no_month_over_month_change():
+    dates = (np.datetime64('2000-01', 'M') + np.arange(0, 24, 3)).astype('datetime64[D]')
+    assert np.isnan(change_over(dates, np.arange(1, 9, dtype=np.float64), 1, 'Q')).all()
+
+
+def test_daily_series_looks_back_over_weekends():
+    # Business days only: a year before a Monday may fall on a weekend
+    dates = np.arange('2000-01-03', '2002-01-01', dtype='datetime64[D]')
+    dates = dates[np.is_busday(dates)]
+    values = np.arange(1, len(dates) + 1, dtype=np.float64)
+    yoy = change_over(dates, values, 12, 'D')
+
+    assert np.isfinite(yoy[dates >= np.datetime64('2001-01-10')]).all()
+
+
+@pytest.mark.parametrize('months', [1, 3, 12, 13])
+def test_month_end_dates_clamp_to_the_end_of_shorter_months(months):
+    dates = np.arange('2023-01-01', '2025-01-01', dtype='datetime64[D]')
+    expected = (pd.DatetimeIndex(dates) - pd.DateOffset(months=months)).to_numpy().astype('datetime64[D]')
+
+    assert np.array_equal(_shift_months(dates, months), expected)
+    assert _shift_months(np.array(['2024-03-31'], dtype='datetime64[D]'), 1)[0] == np.datetime64('2024-02-29')
+
+
+def test_growth_metrics_of_a_window():
+    dates = monthly_dates('2000-01', 121)
+    values = 100 * 1.005 ** np.arange(121)
+    metrics = compute_series_metrics(dates, values, 'M')
+
+    assert metrics['count'] == 121
+    assert metrics['years'] == pytest.approx(10, abs=0.01)
+    assert metrics['cumulative_change'] == pytest.approx((1.005 ** 120 - 1) * 100)
+    assert metrics['cagr'] == pytest.approx((1.005 ** 12 - 1) * 100, rel=1e-3)
+    assert metrics['avg_yoy'] == pytest.approx((1.005 ** 12 - 1) * 100)
+
+
+def test_metrics_of_an_empty_window():
+    metrics = compute_series_metrics(np.array([], dtype='datetime64[D]'), np.array([]), 'M')
+    assert metrics['count'] == 0 and np.isnan(metrics['avg_yoy']) and np.isnan(metrics['cagr'])
+
+
+def test_single_observation_window_has_not_changed():
+    metrics = compute_series_metrics(monthly_dates('2020-01', 1), np.array([5.0]), 'M')
+    assert metrics['cumulative_change'] == 0 and np.isnan(metrics['cagr'])
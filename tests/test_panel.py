@@ -0,0 +1,51 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from conftest import monthly_dates
+from fed_analysis.panel import RESAMPLE_RULES, SeriesPanel, infer_frequency
+
+
+def frame(dates, seed):
+    values = np.random.default_rng(seed).normal(0, 1, len(dates)).cumsum()
+    values[::17] = np.nan
+    return pd.DataFrame({'date': pd.DatetimeIndex(dates), 'value': values})
+
+
+@pytest.fixture
+def frames():
+    daily = np.arange('1990-01-01', '2001-01-01', dtype='datetime64[D]')
+    quarterly = (np.datetime64('1985-01', 'M') + np.arange(0, 60, 3)).astype('datetime64[D]')
+    return {
+        'DGS10': frame(daily[np.is_busday(daily)], 0),
+        'CPIAUCSL': frame(monthly_dates('1995-01', 120), 1),
+        'GDP': frame(quarterly, 2),
+        # Disjoint from the others, so the calendar has a hole between the spans
+        'LATE': frame(monthly_dates('2010-01', 24), 3),
+    }
+
+
+def test_infers_native_frequencies(frames):
+    panel = SeriesPanel.from_frames(frames)
+    assert [panel.frequency(s) for s in ('DGS10', 'CPIAUCSL', 'GDP')] == ['D', 'M', 'Q']
+    assert panel.common_frequency() == 'Q'
+    assert infer_frequency(np.array(['2000-01-01'], dtype='datetime64[D]')) == 'A'
+
+
+@pytest.mark.parametrize('frequency', ['W', 'M', 'Q', 'A'])
+@pytest.mark.parametrize('how', ['mean', 'last'])
+def test_aligned_view_matches_pandas_resampling(frames, frequency, how):
+    panel = SeriesPanel.from_frames(frames, how={'DGS10': how})
+    aligned = panel.aligned(frequency)
+
+    expected = pd.DataFrame({
+        series_id: series.resample(RESAMPLE_RULES[frequency]).agg(panel._how.get(series_id, 'mean'))
+        for series_id, series in panel._series.items()
+    })
+    pd.testing.assert_frame_equal(aligned, expected, check_freq=False)
+
+
+def test_coarser_series_are_left_with_gaps(frames):
+    aligned = SeriesPanel.from_frames(frames).aligned('M')
+    gdp = aligned['GDP'].loc['1990-01-01':'1999-12-01']
+    assert gdp.isna().sum() >= 2 * gdp.notna().sum()
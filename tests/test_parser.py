@@ -0,0 +1,39 @@
+import json
+
+import numpy as np
+import pytest
+
+from conftest import observations_payload
+from fed_analysis.parser import parse_observations
+
+
+def test_parses_dates_and_values_with_missing_as_nan():
+    dates = np.array(['2020-01-01', '2020-02-01', '2020-03-01'], dtype='datetime64[D]')
+    dates_out, values_out = parse_observations(observations_payload(dates, [1.5, np.nan, -2.25]))
+
+    assert dates_out.dtype == np.dtype('datetime64[D]')
+    assert np.array_equal(dates_out, dates)
+    assert np.array_equal(values_out, [1.5, np.nan, -2.25], equal_nan=True)
+
+
+def test_matches_the_generic_json_path():
+    dates = np.datetime64('1962-01-02') + np.arange(500)
+    values = np.round(np.random.default_rng(0).normal(4, 1, 500), 2)
+    values[::20] = np.nan
+    payload = observations_payload(dates, values)
+
+    observations = json.loads(payload)['observations']
+    expected = [np.nan if o['value'] == '.' else float(o['value']) for o in observations]
+    parsed_dates, parsed_values = parse_observations(payload)
+    assert [str(d) for d in parsed_dates] == [o['date'] for o in observations]
+    assert np.array_equal(parsed_values, expected, equal_nan=True)
+
+
+def test_empty_payload():
+    dates, values = parse_observations(b'{"count":0,"observations":[]}')
+    assert len(dates) == 0 and len(values) == 0
+
+
+def test_mismatched_dates_and_values_are_rejected():
+    with pytest.raises(ValueError, match='Malformed'):
+        parse_observations(b'{"observations":[{"date":"2020-01-01"}]}')
@@ -0,0 +1,41 @@
+import numpy as np
+
+from fed_analysis.pyramid import SeriesPyramid
+
+
+def test_overview_keeps_extremes_and_range_ends():
+    values = np.random.default_rng(1).normal(0, 1, 20_000).cumsum()
+    pyramid = SeriesPyramid(values)
+    lo, hi = 1_000, 19_000
+    positions = pyramid.select(lo, hi, 300)
+
+    assert len(positions) <= 300 + 2
+    assert positions[0] == lo and positions[-1] == hi - 1
+    assert np.all(np.diff(positions) > 0)
+    assert lo + np.argmax(values[lo:hi]) in positions
+    assert lo + np.argmin(values[lo:hi]) in positions
+
+
+def test_overview_keeps_the_extremes_of_ranges_cutting_through_buckets():
+    rng = np.random.default_rng(2)
+    values = rng.normal(0, 1, 5_000).cumsum()
+    pyramid = SeriesPyramid(values)
+    for _ in range(200):
+        lo, hi = np.sort(rng.choice(len(values) + 1, 2, replace=False))
+        max_points = int(rng.integers(3, 400))
+        positions = pyramid.select(lo, hi, max_points)
+
+        assert values[positions].min() == values[lo:hi].min()
+        assert values[positions].max() == values[lo:hi].max()
+        assert positions[0] == lo and positions[-1] == hi - 1
+
+
+def test_short_ranges_are_returned_whole():
+    pyramid = SeriesPyramid(np.arange(1_000, dtype=np.float64))
+    assert np.array_equal(pyramid.select(10, 110, 300), np.arange(10, 110))
+
+
+def test_levels_halve_the_buckets():
+    pyramid = SeriesPyramid(np.arange(1_024, dtype=np.float64))
+    assert [len(level[2]) for level in pyramid.levels] == [512, 256, 128, 64, 32, 16]
+    assert np.array_equal(pyramid.levels[0][1], np.arange(1, 1_024, 2))
@@ -0,0 +1,87 @@
+import os
+
+import numpy as np
+import pytest
+
+from conftest import monthly_dates
+from fed_analysis import store as store_module
+
+
+def history_files(store, series_id):
+    return sorted(os.listdir(store._history_dir(series_id)))
+
+
+@pytest.fixture
+def stored(store):
+    dates = monthly_dates('2000-01', 24)
+    values = np.arange(24, dtype=np.float64)
+    values[5] = np.nan
+    store.append('CPIAUCSL', dates, values)
+    return store
+
+
+def test_history_maps_the_stored_observations(stored):
+    dates, values = stored.history('CPIAUCSL')
+
+    assert isinstance(values, np.memmap) and not values.flags.writeable
+    assert dates.dtype == np.dtype('datetime64[D]') and values.dtype == np.float64
+    stored_dates, stored_values = stored.read('CPIAUCSL')
+    assert np.array_equal(dates, stored_dates) and np.array_equal(values, stored_values)
+    assert len(values) == 23
+
+
+def test_new_observations_supersede_the_mapped_history(stored):
+    old_dates, _ = stored.history('CPIAUCSL')
+    stored.append('CPIAUCSL', monthly_dates('2002-01', 1), np.array([99.0]))
+
+    dates, values = stored.history('CPIAUCSL')
+    assert len(dates) == 24 and values[-1] == 99.0
+    # A history mapped before the write stays whole
+    assert len(old_dates) == 23
+    assert len(history_files(stored, 'CPIAUCSL')) == 1
+
+
+def test_histories_a_platform_cannot_remove_are_left_for_later(stored, monkeypatch):
+    def refuse(path):
+        raise PermissionError('mapped by another process')
+
+    monkeypatch.setattr(store_module.os, 'remove', refuse)
+    stored.append('CPIAUCSL', monthly_dates('2002-01', 1), np.array([99.0]))
+    assert len(history_files(stored, 'CPIAUCSL')) == 2
+    assert stored.history('CPIAUCSL')[1][-1] == 99.0
+
+    monkeypatch.undo()
+    stored.append('CPIAUCSL', monthly_dates('2002-02', 1), np.array([100.0]))
+    assert len(history_files(stored, 'CPIAUCSL')) == 1
+
+
+def test_failed_write_leaves_the_previous_history(stored, monkeypatch):
+    def full_disk(file, array):
+        file.write(b'\x93NUMPY')
+        raise OSError(28, 'No space left on device')
+
+    monkeypatch.setattr(store_module.np, 'save', full_disk)
+    with pytest.raises(OSError):
+        stored.append('CPIAUCSL', monthly_dates('2002-01', 1), np.array([99.0]))
+    monkeypatch.undo()
+
+    dates, values = stored.history('CPIAUCSL')
+    assert len(dates) == len(values) == 23
+    assert [name[-4:] for name in history_files(stored, 'CPIAUCSL')] == ['.npy']
+
+
+def test_missing_history_is_rebuilt_from_the_observations(stored):
+    for name in history_files(stored, 'CPIAUCSL'):
+        os.remove(os.path.join(stored._history_dir('CPIAUCSL'), name))
+
+    dates, values = stored.history('CPIAUCSL')
+    assert len(dates) == 23 and isinstance(values, np.memmap)
+
+
+def test_history_replaced_under_every_read_falls_back_to_the_observations(stored, monkeypatch):
+    def vanished(path, mmap_mode=None):
+        raise FileNotFoundError(path)
+
+    monkeypatch.setattr(store_module.np, 'load', vanished)
+    dates, values = stored.history('CPIAUCSL')
+    assert len(dates) == len(values) == 23